@@ -4,15 +4,46 @@ QUADRUPLE GODDESS v3.5 - ENHANCED SYSTEM
 Integrated Divination: Geomancy + I Ching + Tarot + Jafr
 """
 
+import atexit
+import csv
+import hashlib
+import io
 import json
+import os
 import random
 import sys
-import platform
-import hashlib
+import tarfile
 import math
-from datetime import datetime, timedelta
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from enum import Enum
+from itertools import accumulate
+from types import MappingProxyType
+
+try:
+    import orjson  # optional: faster JSON load/dump
+except ImportError:
+    orjson = None
+
+def _json_bytes(obj, indent=False):
+    """Serialize obj to UTF-8 JSON, via orjson when it is installed"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    # Same layout as orjson: raw UTF-8, compact unless indented
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+def _read_json_file(filename):
+    """Read and parse a JSON file in one go"""
+    with open(filename, 'rb') as f:
+        return _json_loads(f.read())
 
 # ============ ENUMS & CONSTANTS ============
 class Planet(Enum):
@@ -32,11 +63,214 @@ class Element(Enum):
     METAL = "Metal"
     WOOD = "Wood"
 
+_PLANET_BY_NAME = {p.value: p for p in Planet}
+_ELEMENT_BY_NAME = {e.value: e for e in Element}
+
+def _as_planet(value):
+    """Coerce a planet name (or Planet) to Planet; None if unknown"""
+    if isinstance(value, Planet):
+        return value
+    return _PLANET_BY_NAME.get(value)
+
+def _as_element(value):
+    """Coerce an element name (or Element) to Element; None if unknown"""
+    if isinstance(value, Element):
+        return value
+    return _ELEMENT_BY_NAME.get(value)
+
 # Planetary hours (traditional Chaldean order)
-PLANETARY_HOURS = [
+PLANETARY_HOURS = (
     "Saturn", "Jupiter", "Mars", "Sun", 
     "Venus", "Mercury", "Moon"
-]
+)
+
+# Day rulers indexed by datetime.weekday()
+DAY_PLANETS = ("Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn")
+
+# Position of each weekday's ruler in the Chaldean sequence
+_START_IDX = tuple(PLANETARY_HOURS.index(p) for p in DAY_PLANETS)
+
+# Trigram lookup tables (binary lines -> symbol, symbol -> name/correspondence)
+_TRIGRAM_SYMBOLS = {
+    "111": "☰",  # Heaven
+    "110": "☱",  # Lake
+    "101": "☲",  # Fire
+    "100": "☳",  # Thunder
+    "011": "☴",  # Wind
+    "010": "☵",  # Water
+    "001": "☶",  # Mountain
+    "000": "☷",   # Earth
+}
+
+_TRIGRAM_NAMES = {
+    "☰": "Heaven",
+    "☱": "Lake", 
+    "☲": "Fire",
+    "☳": "Thunder",
+    "☴": "Wind",
+    "☵": "Water",
+    "☶": "Mountain",
+    "☷": "Earth"
+}
+
+_OGDOAD = {
+    "☰": "Heaven (Nu/Naunet - Primordial Waters)",
+    "☷": "Earth (Amun/Amaunet - Hidden Force)",
+    "☲": "Fire (Heh/Hauhet - Infinity)",
+    "☵": "Water (Kuk/Kauket - Darkness)",
+    "☳": "Thunder (Niau/Niaut)",
+    "☴": "Wind (etc.)",
+    "☶": "Mountain",
+    "☱": "Lake"
+}
+
+_TRIGRAM_ESSENCE = {
+    "☰": "Creative force",
+    "☷": "Receptive ground", 
+    "☲": "Illuminating fire",
+    "☵": "Deep water",
+    "☳": "Awakening thunder",
+    "☴": "Penetrating wind",
+    "☶": "Stable mountain",
+    "☱": "Joyful lake"
+}
+
+# Every (lower, upper) trigram pairing: a named interaction or the essence blend
+_TRIGRAM_PAIR_TABLE = {
+    (lo, up): f"{_TRIGRAM_ESSENCE[lo]} (foundation) supporting {_TRIGRAM_ESSENCE[up]} (expression)"
+    for lo in _TRIGRAM_ESSENCE for up in _TRIGRAM_ESSENCE
+}
+_TRIGRAM_PAIR_TABLE.update({
+    ("☰", "☰"): "Heaven upon Heaven: Pure creative force, ultimate power",
+    ("☰", "☷"): "Heaven upon Earth: Creative manifestation, ideal meeting reality",
+    ("☷", "☰"): "Earth upon Heaven: Receptive to divine inspiration",
+    ("☲", "☵"): "Fire upon Water: Passion meeting emotion, transformative alchemy",
+    ("☵", "☲"): "Water upon Fire: Emotion tempering passion, controlled transformation",
+})
+
+# Hexagram is 6 lines, split into upper (first 3) and lower (last 3)
+_HEX_TO_TRIGRAM_PAIR = {
+    b: (_TRIGRAM_SYMBOLS[b[3:]], _TRIGRAM_SYMBOLS[b[:3]])
+    for b in (f"{i:06b}" for i in range(64))
+}
+
+# 3-coin toss pattern (one bit per coin, 1 = heads worth 3) -> (line, is_changing)
+# 0 heads = 6 old yin, 1 = 7 young yang, 2 = 8 young yin, 3 = 9 old yang
+_COIN_TABLE = tuple(
+    ((0, True), (1, False), (0, False), (1, True))[bin(pattern).count("1")]
+    for pattern in range(8)
+)
+
+# Yarrow stalk odds in sixteenths (each of the three divisions leaves a small
+# remainder with p = 3/4, 1/2, 1/2): 6 = 1/16, 7 = 5/16, 8 = 7/16, 9 = 3/16
+_YARROW_TABLE = tuple(
+    (0, True) if k < 1 else (1, False) if k < 6 else (0, False) if k < 13 else (1, True)
+    for k in range(16)
+)
+
+# Decimal values of every trigram (3), geomantic (4) and hexagram (6) bit string
+_BIN2DEC = {f"{i:0{w}b}": i for w in (3, 4, 6) for i in range(1 << w)}
+
+# Dot pattern of each geomantic figure, one row per bit
+_GEOMANTIC_DOTS = {
+    f"{i:04b}": "\n".join("●●" if bit == '1' else "○ ○" for bit in f"{i:04b}")
+    for i in range(16)
+}
+
+def _binary_to_decimal(binary_str):
+    """Convert binary string to decimal (0 if empty or not binary)"""
+    if not binary_str:
+        return 0
+    value = _BIN2DEC.get(binary_str)
+    if value is not None:
+        return value
+    try:
+        return int(binary_str, 2)
+    except (TypeError, ValueError):
+        return 0
+
+# Hermetic synthesis correspondence tables
+_THOTH_MAP = {
+    Element.FIRE: "Will/Energy (Sulfur principle)",
+    Element.WATER: "Emotion/Intuition (Mercury principle)",
+    Element.AIR: "Intellect/Mind (Salt principle)",
+    Element.EARTH: "Manifestation/Body (Salt principle)",
+    Element.METAL: "Structure/Contraction",
+    Element.WOOD: "Growth/Expansion"
+}
+
+_DIRECTIONS = {
+    Element.FIRE: "South",
+    Element.WATER: "West",
+    Element.AIR: "East",
+    Element.EARTH: "North"
+}
+
+_PLANET_QUALITIES = {
+    Planet.SUN: "Vitality, success, leadership",
+    Planet.MOON: "Intuition, emotions, receptivity",
+    Planet.MERCURY: "Communication, intellect, travel",
+    Planet.VENUS: "Love, beauty, harmony",
+    Planet.MARS: "Action, courage, conflict",
+    Planet.JUPITER: "Expansion, luck, wisdom",
+    Planet.SATURN: "Discipline, structure, karma"
+}
+
+_RHYTHMS = {
+    Element.FIRE: "Quick, decisive actions in 3-day cycles",
+    Element.WATER: "Fluid, intuitive timing - follow emotional cues",
+    Element.AIR: "Mental focus in morning, communication in afternoon",
+    Element.EARTH: "Slow, steady progress with weekly checkpoints"
+}
+
+_NUMBER_MEANINGS = {
+    1: "Unity, Beginning",
+    2: "Duality, Balance",
+    3: "Creativity, Trinity",
+    4: "Stability, Foundation",
+    5: "Change, Movement",
+    6: "Harmony, Balance",
+    7: "Wisdom, Mystery",
+    8: "Power, Manifestation",
+    9: "Completion, Wisdom"
+}
+
+@lru_cache(maxsize=256)
+def _reduce_number(num):
+    """Reduce number to single digit (Pythagorean numerology)"""
+    if num > 9:
+        num = 1 + (num - 1) % 9  # digital root
+    return f"{num}: {_NUMBER_MEANINGS.get(num, 'Mystery')}"
+
+# Per-thread (and per-process) RNG so bulk casting never shares one generator
+_LOCAL = threading.local()
+# Bumped by seed_rng so every thread rebuilds its generator on next use
+_rng_generation = 0
+
+def seed_rng(seed=None):
+    """Seed random and restart the casting generators from it (reproducible readings)"""
+    global _rng_generation
+    random.seed(seed)
+    _rng_generation += 1
+
+def _rng():
+    """Return this thread's random.Random, reseeding after a fork or seed_rng"""
+    pid = os.getpid()
+    if getattr(_LOCAL, "pid", None) != pid or _LOCAL.generation != _rng_generation:
+        # Drawn from the global generator, so a seeded random reproduces casts
+        # (random itself is reseeded in forked children)
+        _LOCAL.rng = random.Random(random.getrandbits(64))
+        _LOCAL.pid = pid
+        _LOCAL.generation = _rng_generation
+    return _LOCAL.rng
+
+def _get_trigram_symbols(binary_str):
+    """Convert binary string to (lower, upper) trigram symbols"""
+    return _HEX_TO_TRIGRAM_PAIR.get(binary_str, ("?", "?"))
+
+def _get_trigram_name(symbol):
+    """Get name of trigram from symbol"""
+    return _TRIGRAM_NAMES.get(symbol, "Unknown")
 
 # ============ I CHING CASTER CLASS ============
 class IChingCaster:
@@ -45,21 +279,49 @@ class IChingCaster:
     @staticmethod
     def cast_coins():
         """Traditional 3-coin method"""
+        # One draw covers all 18 coins (6 lines x 3 coins)
+        return IChingCaster._lines_from_bits(_rng().getrandbits(18), _COIN_TABLE, 3)
+    
+    @staticmethod
+    def cast_coins_batch(n, seed=None):
+        """Cast n coin-method hexagrams from a single random draw"""
+        if n <= 0:
+            return []
+        rng = _rng() if seed is None else random.Random(seed)
+        bits = rng.getrandbits(18 * n)
+        return [
+            IChingCaster._lines_from_bits((bits >> (18 * k)) & 0x3FFFF, _COIN_TABLE, 3)
+            for k in range(n)
+        ]
+    
+    @staticmethod
+    def cast_coins_parallel(n, workers=None):
+        """Cast n coin-method hexagrams split across worker processes"""
+        if n <= 0:
+            return []
+        workers = workers or os.cpu_count() or 1
+        chunk = -(-n // workers)  # ceiling division
+        sizes = [min(chunk, n - start) for start in range(0, n, chunk)]
+        # Seed each batch from this process, so seed_rng reproduces the result
+        seeds = [_rng().getrandbits(64) for _ in sizes]
+        
+        results = []
+        with ProcessPoolExecutor(max_workers=len(sizes)) as pool:
+            for batch in pool.map(IChingCaster.cast_coins_batch, sizes, seeds):
+                results.extend(batch)
+        return results
+    
+    @staticmethod
+    def _lines_from_bits(bits, table, width):
+        """Decode six width-bit fields into (hexagram_lines, changing_lines)"""
         hexagram_lines = []
         changing_lines = []
+        mask = (1 << width) - 1
         
         for line_num in range(6):
-            total = sum([3 if random.random() > 0.5 else 2 for _ in range(3)])
-            
-            if total == 6:
-                hexagram_lines.append(0)
-                changing_lines.append(line_num + 1)
-            elif total == 7:
-                hexagram_lines.append(1)
-            elif total == 8:
-                hexagram_lines.append(0)
-            elif total == 9:
-                hexagram_lines.append(1)
+            line, changing = table[(bits >> (width * line_num)) & mask]
+            hexagram_lines.append(line)
+            if changing:
                 changing_lines.append(line_num + 1)
         
         hexagram_lines.reverse()
@@ -68,288 +330,293 @@ class IChingCaster:
     @staticmethod
     def cast_yarrow_stalks():
         """Traditional yarrow stalk method - CORRECTED"""
-        hexagram_lines = []
-        changing_lines = []
-        
-        for line_position in range(6):
-            # Start with 50 stalks
-            stalks = 50
-            line_value = 0
-            
-            for division in range(3):
-                stalks -= 1  # Remove one stalk
-                # Divide into two random groups
-                if stalks > 1:
-                    group1 = random.randint(1, stalks - 1)
-                else:
-                    group1 = 1
-                group2 = stalks - group1
-                
-                # Calculate remainders
-                remainder1 = 4 if (group1 % 4 == 0) else group1 % 4
-                remainder2 = 4 if (group2 % 4 == 0) else group2 % 4
-                remainder = remainder1 + remainder2
-                
-                # Update stalks and accumulate line value
-                stalks = stalks - remainder
-                if division == 2:  # Only care about the final value
-                    line_value = (remainder == 4) * 2 + (remainder == 8) * 3
-            
-            # Map the line value to hexagram line
-            if line_value == 6:  # Old yin (changing)
-                hexagram_lines.append(0)
-                changing_lines.append(6 - line_position)  # Lines are 1-6 from bottom
-            elif line_value == 7:  # Young yang
-                hexagram_lines.append(1)
-            elif line_value == 8:  # Young yin
-                hexagram_lines.append(0)
-            elif line_value == 9:  # Old yang (changing)
-                hexagram_lines.append(1)
-                changing_lines.append(6 - line_position)  # Lines are 1-6 from bottom
-        
-        # In I Ching, lines are stored bottom to top, but we process top to bottom
-        hexagram_lines.reverse()
-        # Also need to adjust changing lines indices since we reversed
-        changing_lines = [7 - line for line in changing_lines] if changing_lines else []
-        
-        return hexagram_lines, changing_lines
+        # Sample each line straight from the yarrow distribution rather
+        # than simulating the 49-stalk divisions: one 4-bit draw per line
+        return IChingCaster._lines_from_bits(_rng().getrandbits(24), _YARROW_TABLE, 4)
     
-    @staticmethod
-    def get_trigram_symbols(binary_str):
-        """Convert binary string to trigram symbols"""
-        # Define trigram mappings
-        trigrams = {
-            "111": "☰",  # Heaven
-            "110": "☱",  # Lake
-            "101": "☲",  # Fire
-            "100": "☳",  # Thunder
-            "011": "☴",  # Wind
-            "010": "☵",  # Water
-            "001": "☶",  # Mountain
-            "000": "☷",   # Earth
-        }
-        
-        # Hexagram is 6 lines, split into upper (first 3) and lower (last 3)
-        if len(binary_str) == 6:
-            lower_trigram = binary_str[3:]  # Lines 4-6 (bottom)
-            upper_trigram = binary_str[:3]  # Lines 1-3 (top)
-            
-            lower_symbol = trigrams.get(lower_trigram, "?")
-            upper_symbol = trigrams.get(upper_trigram, "?")
-            
-            return lower_symbol, upper_symbol
-        
-        return "?", "?"
-    
-    @staticmethod
-    def get_trigram_name(symbol):
-        """Get name of trigram from symbol"""
-        trigram_names = {
-            "☰": "Heaven",
-            "☱": "Lake", 
-            "☲": "Fire",
-            "☳": "Thunder",
-            "☴": "Wind",
-            "☵": "Water",
-            "☶": "Mountain",
-            "☷": "Earth"
-        }
-        return trigram_names.get(symbol, "Unknown")
+    get_trigram_symbols = staticmethod(_get_trigram_symbols)
+    get_trigram_name = staticmethod(_get_trigram_name)
 
 # ============ PLANETARY HOUR CALCULATOR ============
-class PlanetaryHourCalculator:
-    """Calculate planetary hours for talisman timing"""
+@lru_cache(maxsize=8)
+def _build_schedule(weekday):
+    """Build the 24-hour planetary schedule for a weekday (only 7 exist)
+
+    The cached entries are shared, so they are read-only views; the public
+    getters hand out copies.
+    """
+    start_index = _START_IDX[weekday]
     
-    @staticmethod
-    def calculate_current_planetary_hour():
-        """Calculate current planetary hour"""
+    schedule = []
+    for i in range(12):  # 12 day hours
+        planet_index = (start_index + i) % 7
+        schedule.append(MappingProxyType({
+            "hour": i + 1,
+            "planet": PLANETARY_HOURS[planet_index],
+            "type": "day"
+        }))
+    
+    for i in range(12):  # 12 night hours
+        planet_index = (start_index + 12 + i) % 7
+        schedule.append(MappingProxyType({
+            "hour": i + 1,
+            "planet": PLANETARY_HOURS[planet_index],
+            "type": "night"
+        }))
+    
+    return tuple(schedule)
+
+@lru_cache(maxsize=32)
+def _planetary_hour(weekday, hour_number, is_daytime):
+    """Resolve the ruling planet for an hour; valid for up to an hour"""
+    # Planetary hour sequence starts with the day's ruling planet
+    # For simplicity, using Sunday as example
+    planet_index = (_START_IDX[weekday] + hour_number) % 7
+    
+    return {
+        "planet": PLANETARY_HOURS[planet_index],
+        "hour_number": hour_number + 1,
+        "is_daytime": is_daytime
+    }
+
+def _calculate_current_planetary_hour(now=None):
+    """Calculate current planetary hour"""
+    if now is None:
         now = datetime.now()
-        sunrise = now.replace(hour=6, minute=0, second=0, microsecond=0)
-        sunset = now.replace(hour=18, minute=0, second=0, microsecond=0)
-        
-        # Simple calculation - in reality this uses sunrise/sunset times
-        if sunrise <= now < sunset:
-            # Day hours
-            total_day_minutes = 12 * 60
-            minutes_since_sunrise = (now - sunrise).total_seconds() / 60
-            hour_number = int(minutes_since_sunrise / (total_day_minutes / 12))
+    sunrise = now.replace(hour=6, minute=0, second=0, microsecond=0)
+    sunset = now.replace(hour=18, minute=0, second=0, microsecond=0)
+    is_daytime = sunrise <= now < sunset
+    
+    # Simple calculation - in reality this uses sunrise/sunset times
+    if is_daytime:
+        # Day hours
+        total_day_minutes = 12 * 60
+        minutes_since_sunrise = (now - sunrise).total_seconds() / 60
+        hour_number = int(minutes_since_sunrise / (total_day_minutes / 12))
+    else:
+        # Night hours
+        total_night_minutes = 12 * 60
+        if now < sunrise:
+            minutes_since_sunset = (now - (sunset - timedelta(days=1))).total_seconds() / 60
         else:
-            # Night hours
-            total_night_minutes = 12 * 60
-            if now < sunrise:
-                minutes_since_sunset = (now - (sunset - timedelta(days=1))).total_seconds() / 60
-            else:
-                minutes_since_sunset = (now - sunset).total_seconds() / 60
-            hour_number = int(minutes_since_sunset / (total_night_minutes / 12))
-        
-        # Planetary hour sequence starts with the day's ruling planet
-        # For simplicity, using Sunday as example
-        day_of_week = now.weekday()
-        day_planets = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn"]
-        day_ruler = day_planets[day_of_week]
-        
-        # Find index of day ruler
-        start_index = PLANETARY_HOURS.index(day_ruler)
-        planet_index = (start_index + hour_number) % 7
-        
-        return {
-            "planet": PLANETARY_HOURS[planet_index],
-            "hour_number": hour_number + 1,
-            "is_daytime": sunrise <= now < sunset
-        }
+            minutes_since_sunset = (now - sunset).total_seconds() / 60
+        hour_number = int(minutes_since_sunset / (total_night_minutes / 12))
     
-    @staticmethod
-    def get_planetary_hour_schedule(date=None):
-        """Get planetary hour schedule for a date"""
-        if date is None:
-            date = datetime.now()
-        
-        schedule = []
-        day_planets = ["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn"]
-        day_ruler = day_planets[date.weekday()]
-        
-        start_index = PLANETARY_HOURS.index(day_ruler)
-        
-        for i in range(12):  # 12 day hours
-            planet_index = (start_index + i) % 7
-            schedule.append({
-                "hour": i + 1,
-                "planet": PLANETARY_HOURS[planet_index],
-                "type": "day"
-            })
-        
-        for i in range(12):  # 12 night hours
-            planet_index = (start_index + 12 + i) % 7
-            schedule.append({
-                "hour": i + 1,
-                "planet": PLANETARY_HOURS[planet_index],
-                "type": "night"
-            })
-        
-        return schedule
+    return dict(_planetary_hour(now.weekday(), hour_number, is_daytime))
 
-# ============ Hermetic Synthesis ============
+def _get_planetary_hour_schedule(date=None):
+    """Get planetary hour schedule for a date"""
+    if date is None:
+        date = datetime.now()
+    
+    return [dict(hour) for hour in _build_schedule(date.weekday())]
 
-class HermeticSynthesis:
-    """Hermetic synthesis connecting all systems through mathematical correspondences"""
+@lru_cache(maxsize=8)
+def _build_schedule_index(weekday):
+    """Planet -> that weekday's schedule entries it rules, in schedule order"""
+    index = {}
+    for hour in _build_schedule(weekday):
+        index.setdefault(hour["planet"], []).append(hour)
+    return MappingProxyType({planet: tuple(hours) for planet, hours in index.items()})
+
+def _get_schedule_by_planet(date=None):
+    """Get a date's planetary hours grouped by ruling planet"""
+    if date is None:
+        date = datetime.now()
     
-    def generate_hermetic_synthesis(self, geomantic, iching, tarot, planetary_hour):
-        """Generate synthesis based on Thoth/Hermetic principles"""
-        
-        # Calculate numerical correspondences
-        geomantic_num = self.binary_to_decimal(geomantic['binary'])
-        iching_num = iching['primary']['number']
-        tarot_num = tarot.get('number', 0)
-        
-        # Get trigram correspondences
-        trigrams = iching.get('trigram_symbols', {})
-        lower_trigram = trigrams.get('lower', '?')
-        upper_trigram = trigrams.get('upper', '?')
-        
-        # Analyze mathematical patterns
-        mathematical_analysis = self.analyze_mathematical_patterns(
-            geomantic['binary'], 
-            iching['binary'], 
-            tarot_num
-        )
-        
-        synthesis = f"""
+    return {planet: tuple(dict(hour) for hour in hours)
+            for planet, hours in _build_schedule_index(date.weekday()).items()}
+
+class PlanetaryHourCalculator:
+    """Calculate planetary hours for talisman timing"""
+    
+    calculate_current_planetary_hour = staticmethod(_calculate_current_planetary_hour)
+    get_planetary_hour_schedule = staticmethod(_get_planetary_hour_schedule)
+    get_schedule_by_planet = staticmethod(_get_schedule_by_planet)
+
+# ============ Hermetic Synthesis ============
+
+_HERMETIC_TEMPLATE = """
         🜍 HERMETIC SYNTHESIS (Thoth/Ogdoad Framework)
-        {'═' * 60}
+        ════════════════════════════════════════════════════════════
         
         🔢 MATHEMATICAL CORRESPONDENCES:
-        • Geomancy Binary: {geomantic['binary']} (Decimal: {geomantic_num})
-        • I Ching Binary: {iching['binary']} (Hexagram #{iching_num})
-        • Tarot Number: {tarot_num} ({tarot.get('suit', 'Major Arcana')})
-        • Planetary Hour: {planetary_hour['planet']} (Hour {planetary_hour['hour_number']})
+        • Geomancy Binary: {geo_bin} (Decimal: {geo_num})
+        • I Ching Binary: {ich_bin} (Hexagram #{ich_num})
+        • Tarot Number: {tarot_num} ({tarot_suit})
+        • Planetary Hour: {planet} (Hour {hour_number})
         
         🜂 ELEMENTAL TRIANGULATION (Thoth's Four Elements):
-        • Geomancy: {geomantic.get('element', 'Unknown')} → {self.get_thoth_element(geomantic.get('element', ''))}
-        • I Ching: {iching['primary'].get('element', 'Unknown')} → {self.get_thoth_element(iching['primary'].get('element', ''))}
-        • Tarot: {tarot.get('element', 'Unknown')} → {self.get_thoth_element(tarot.get('element', ''))}
+        • Geomancy: {geo_element} → {thoth_geo}
+        • I Ching: {ich_element} → {thoth_ich}
+        • Tarot: {tarot_element} → {thoth_tarot}
         
         🜄 TRIGRAMMATIC CONNECTIONS (Ogdoad Structure):
-        • Lower Trigram: {lower_trigram} → {self.get_ogdoad_correspondence(lower_trigram)}
-        • Upper Trigram: {upper_trigram} → {self.get_ogdoad_correspondence(upper_trigram)}
-        • Combined: {self.analyze_trigram_combination(lower_trigram, upper_trigram)}
+        • Lower Trigram: {lower_trigram} → {ogdoad_lower}
+        • Upper Trigram: {upper_trigram} → {ogdoad_upper}
+        • Combined: {trigram_combination}
         
         {mathematical_analysis}
         
         🜁 INTEGRATED HERMETIC PRINCIPLES:
         
         PRINCIPLE OF CORRESPONDENCE (As Above, So Below):
-        • Geomancy (Earth/Microcosm): {geomantic['name']} represents {geomantic.get('meaning', '')[:50]}...
-        • I Ching (Heaven/Macrocosm): {iching['primary']['english']} represents {iching['primary'].get('judgment_english', '')[:50]}...
-        • Tarot (Mediating Principle): {tarot['name']} connects through {tarot.get('element', 'archetypal')} energy
+        • Geomancy (Earth/Microcosm): {geo_name} represents {geo_meaning}...
+        • I Ching (Heaven/Macrocosm): {ich_english} represents {ich_judgment}...
+        • Tarot (Mediating Principle): {tarot_name} connects through {tarot_energy} energy
         
         PRINCIPLE OF VIBRATION (Numerical Resonance):
-        • Core Vibration: {self.calculate_core_vibration(geomantic_num, iching_num, tarot_num)}
-        • Harmonic Alignment: {self.check_harmonic_alignment(geomantic_num, iching_num, tarot_num)}
+        • Core Vibration: {core_vibration}
+        • Harmonic Alignment: {harmonic_alignment}
         
         PRINCIPLE OF RHYTHM (Temporal Alignment):
-        • Current Timing: {planetary_hour['planet']} hour - {self.get_planet_quality(planetary_hour['planet'])}
-        • Optimal Rhythm: {self.calculate_optimal_rhythm(geomantic, iching, tarot)}
+        • Current Timing: {planet} hour - {planet_quality}
+        • Optimal Rhythm: {optimal_rhythm}
         
         🜃 PRACTICAL APPLICATION (Hermetic Art):
         
         1. MEDITATION FOCUS (Mental Plane):
-           "Contemplate the unification of {geomantic['name']} (form), 
-           {iching['primary']['english']} (principle), and {tarot['name']} (archetype)"
+           "Contemplate the unification of {geo_name} (form), 
+           {ich_english} (principle), and {tarot_name} (archetype)"
         
         2. RITUAL STRUCTURE (Astral Plane):
-           • Time: During {planetary_hour['planet']}'s hour
-           • Space: Facing {self.get_direction(geomantic.get('element', ''))}
-           • Elements: {self.get_ritual_elements(geomantic, iching, tarot)}
+           • Time: During {planet}'s hour
+           • Space: Facing {direction}
+           • Elements: {ritual_elements}
         
         3. PRACTICAL WORK (Physical Plane):
-           • Immediate: {self.get_hermetic_action(geomantic, 'immediate')}
-           • Strategic: {self.get_hermetic_strategy(iching, 'strategic')}
-           • Transformational: {self.get_hermetic_transformation(tarot, 'transformational')}
+           • Immediate: {action}
+           • Strategic: {strategy}
+           • Transformational: {transformation}
         
         🜀 REFLECTIVE QUESTIONS (Emerald Tablet):
-        1. "How does the binary pattern {geomantic['binary']} reflect in my current situation?"
+        1. "How does the binary pattern {geo_bin} reflect in my current situation?"
         2. "What does the movement from {lower_trigram} to {upper_trigram} teach about my path?"
-        3. "How can I embody the {tarot['name']} energy while grounded in {geomantic['name']}?"
+        3. "How can I embody the {tarot_name} energy while grounded in {geo_name}?"
         
         🔷 OGDOAD CONNECTION (Eightfold Path):
-        This reading connects to the {self.get_ogdoad_aspect(geomantic, iching, tarot)} 
+        This reading connects to the {ogdoad_aspect} 
         aspect of the Eightfold creation principle.
         """
+
+# Fields the synthesis reads; nothing else can change its text
+_SYNTH_GEO_FIELDS = ("binary", "name", "meaning", "element")
+_SYNTH_PRIMARY_FIELDS = ("number", "english", "judgment_english", "element")
+_SYNTH_TAROT_FIELDS = ("number", "suit", "name", "element")
+_SYNTH_HOUR_FIELDS = ("planet", "hour_number")
+
+def _freeze(data, fields):
+    """Immutable (key, value) snapshot of the given fields present in data"""
+    return tuple((k, data[k]) for k in fields if k in data)
+
+class HermeticSynthesis:
+    """Hermetic synthesis connecting all systems through mathematical correspondences"""
+    
+    def generate_hermetic_synthesis(self, geomantic, iching, tarot, planetary_hour):
+        """Generate synthesis based on Thoth/Hermetic principles"""
+        key = (
+            _freeze(geomantic, _SYNTH_GEO_FIELDS),
+            iching['binary'],
+            _freeze(iching['primary'], _SYNTH_PRIMARY_FIELDS),
+            _freeze(iching.get('trigram_symbols', {}), ("lower", "upper")),
+            _freeze(tarot, _SYNTH_TAROT_FIELDS),
+            _freeze(planetary_hour, _SYNTH_HOUR_FIELDS),
+        )
+        
+        try:
+            return self._cached_synthesis(key)
+        except TypeError:
+            # Unhashable field values - render without caching
+            return self.render_hermetic_synthesis(geomantic, iching, tarot, planetary_hour)
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _cached_synthesis(key):
+        """Render a synthesis from its frozen input signature"""
+        geo, ich_bin, primary, trigrams, tarot, hour = key
+        iching = {
+            "binary": ich_bin,
+            "primary": dict(primary),
+            "trigram_symbols": dict(trigrams)
+        }
+        return HermeticSynthesis().render_hermetic_synthesis(
+            dict(geo), iching, dict(tarot), dict(hour)
+        )
+    
+    def render_hermetic_synthesis(self, geomantic, iching, tarot, planetary_hour):
+        """Build the synthesis text from reading data (uncached)"""
+        
+        # Calculate numerical correspondences
+        geomantic_num = self.binary_to_decimal(geomantic['binary'])
+        iching_num = iching['primary']['number']
+        tarot_num = tarot.get('number', 0)
+        
+        # Get trigram correspondences
+        trigrams = iching.get('trigram_symbols', {})
+        lower_trigram = trigrams.get('lower', '?')
+        upper_trigram = trigrams.get('upper', '?')
+        
+        # Analyze mathematical patterns
+        mathematical_analysis = self.analyze_mathematical_patterns(
+            geomantic['binary'], 
+            iching['binary'], 
+            tarot_num
+        )
+        
+        vals = {
+            "geo_bin": geomantic['binary'],
+            "geo_num": geomantic_num,
+            "ich_bin": iching['binary'],
+            "ich_num": iching_num,
+            "tarot_num": tarot_num,
+            "tarot_suit": tarot.get('suit', 'Major Arcana'),
+            "planet": planetary_hour['planet'],
+            "hour_number": planetary_hour['hour_number'],
+            "geo_element": geomantic.get('element', 'Unknown'),
+            "thoth_geo": self.get_thoth_element(geomantic.get('element', '')),
+            "ich_element": iching['primary'].get('element', 'Unknown'),
+            "thoth_ich": self.get_thoth_element(iching['primary'].get('element', '')),
+            "tarot_element": tarot.get('element', 'Unknown'),
+            "thoth_tarot": self.get_thoth_element(tarot.get('element', '')),
+            "lower_trigram": lower_trigram,
+            "upper_trigram": upper_trigram,
+            "ogdoad_lower": self.get_ogdoad_correspondence(lower_trigram),
+            "ogdoad_upper": self.get_ogdoad_correspondence(upper_trigram),
+            "trigram_combination": self.analyze_trigram_combination(lower_trigram, upper_trigram),
+            "mathematical_analysis": mathematical_analysis,
+            "geo_name": geomantic['name'],
+            "geo_meaning": geomantic.get('meaning', '')[:50],
+            "ich_english": iching['primary']['english'],
+            "ich_judgment": iching['primary'].get('judgment_english', '')[:50],
+            "tarot_name": tarot['name'],
+            "tarot_energy": tarot.get('element', 'archetypal'),
+            "core_vibration": self.calculate_core_vibration(geomantic_num, iching_num, tarot_num),
+            "harmonic_alignment": self.check_harmonic_alignment(geomantic_num, iching_num, tarot_num),
+            "planet_quality": self.get_planet_quality(planetary_hour['planet']),
+            "optimal_rhythm": self.calculate_optimal_rhythm(geomantic, iching, tarot),
+            "direction": self.get_direction(geomantic.get('element', '')),
+            "ritual_elements": self.get_ritual_elements(geomantic, iching, tarot),
+            "action": self.get_hermetic_action(geomantic, 'immediate'),
+            "strategy": self.get_hermetic_strategy(iching, 'strategic'),
+            "transformation": self.get_hermetic_transformation(tarot, 'transformational'),
+            "ogdoad_aspect": self.get_ogdoad_aspect(geomantic, iching, tarot),
+        }
+        
+        synthesis = _HERMETIC_TEMPLATE.format_map(vals)
         
         return synthesis
     
     def binary_to_decimal(self, binary_str):
         """Convert binary string to decimal"""
-        try:
-            return int(binary_str, 2)
-        except:
-            return 0
+        return _binary_to_decimal(binary_str)
     
     def get_thoth_element(self, element):
         """Map elements to Thoth/Hermetic principles"""
-        thoth_map = {
-            "Fire": "Will/Energy (Sulfur principle)",
-            "Water": "Emotion/Intuition (Mercury principle)",
-            "Air": "Intellect/Mind (Salt principle)",
-            "Earth": "Manifestation/Body (Salt principle)",
-            "Metal": "Structure/Contraction",
-            "Wood": "Growth/Expansion"
-        }
-        return thoth_map.get(element, "Transcendent principle")
+        return _THOTH_MAP.get(_as_element(element), "Transcendent principle")
     
     def get_ogdoad_correspondence(self, trigram_symbol):
         """Map trigrams to Ogdoad principles"""
-        ogdoad_map = {
-            "☰": "Heaven (Nu/Naunet - Primordial Waters)",
-            "☷": "Earth (Amun/Amaunet - Hidden Force)",
-            "☲": "Fire (Heh/Hauhet - Infinity)",
-            "☵": "Water (Kuk/Kauket - Darkness)",
-            "☳": "Thunder (Niau/Niaut)",
-            "☴": "Wind (etc.)",
-            "☶": "Mountain",
-            "☱": "Lake"
-        }
-        return ogdoad_map.get(trigram_symbol, "Unified principle")
+        return _OGDOAD.get(trigram_symbol, "Unified principle")
     
     def analyze_mathematical_patterns(self, geomantic_bin, iching_bin, tarot_num):
         """Analyze mathematical relationships between systems"""
@@ -390,8 +657,8 @@ class HermeticSynthesis:
             analysis += "   • Unique numerical signature (no common patterns)\n"
         
         # Add Pythagorean/Platonic analysis
-        geo_sum = sum(int(b) for b in geo_bin)
-        ich_sum = sum(int(b) for b in ich_bin)
+        geo_sum = geo_bin.count("1")
+        ich_sum = ich_bin.count("1")
         
         analysis += f"\n   Pythagorean Analysis:\n"
         analysis += f"   • Geomancy digit sum: {geo_sum} → {self.reduce_number(geo_sum)}\n"
@@ -405,20 +672,7 @@ class HermeticSynthesis:
     
     def reduce_number(self, num):
         """Reduce number to single digit (Pythagorean numerology)"""
-        while num > 9:
-            num = sum(int(d) for d in str(num))
-        meanings = {
-            1: "Unity, Beginning",
-            2: "Duality, Balance",
-            3: "Creativity, Trinity",
-            4: "Stability, Foundation",
-            5: "Change, Movement",
-            6: "Harmony, Balance",
-            7: "Wisdom, Mystery",
-            8: "Power, Manifestation",
-            9: "Completion, Wisdom"
-        }
-        return f"{num}: {meanings.get(num, 'Mystery')}"
+        return _reduce_number(num)
     
     def calculate_core_vibration(self, geo_num, ich_num, tarot_num):
         """Calculate core vibrational number from all systems"""
@@ -439,46 +693,29 @@ class HermeticSynthesis:
         
     def analyze_trigram_combination(self, lower_trigram, upper_trigram):
         """Analyze combination of trigrams"""
-        trigram_interactions = {
-            ("☰", "☰"): "Heaven upon Heaven: Pure creative force, ultimate power",
-            ("☰", "☷"): "Heaven upon Earth: Creative manifestation, ideal meeting reality",
-            ("☷", "☰"): "Earth upon Heaven: Receptive to divine inspiration",
-            ("☲", "☵"): "Fire upon Water: Passion meeting emotion, transformative alchemy",
-            ("☵", "☲"): "Water upon Fire: Emotion tempering passion, controlled transformation",
-        }
-        
         key = (lower_trigram, upper_trigram)
-        if key in trigram_interactions:
-            return trigram_interactions[key]
+        if key in _TRIGRAM_PAIR_TABLE:
+            return _TRIGRAM_PAIR_TABLE[key]
         
-        # Fallback analysis
+        # Unrecognised symbol (e.g. "?") - blend whatever essences are known
         lower_name = self.get_trigram_essence(lower_trigram)
         upper_name = self.get_trigram_essence(upper_trigram)
         return f"{lower_name} (foundation) supporting {upper_name} (expression)"
     
     def get_trigram_essence(self, trigram):
         """Get essence of trigram"""
-        essences = {
-            "☰": "Creative force",
-            "☷": "Receptive ground", 
-            "☲": "Illuminating fire",
-            "☵": "Deep water",
-            "☳": "Awakening thunder",
-            "☴": "Penetrating wind",
-            "☶": "Stable mountain",
-            "☱": "Joyful lake"
-        }
-        return essences.get(trigram, "Unknown trigram")
+        return _TRIGRAM_ESSENCE.get(trigram, "Unknown trigram")
     
     def check_harmonic_alignment(self, geomantic_num, iching_num, tarot_num):
         """Check harmonic alignment between numbers"""
         numbers = [geomantic_num, iching_num, tarot_num]
         
-        # Check for common divisors
-        common_divisors = []
-        for i in range(2, 10):
-            if all(n % i == 0 for n in numbers if n > 0):
-                common_divisors.append(i)
+        # Check for common divisors: every shared divisor divides the gcd
+        g = 0
+        for n in numbers:
+            if n > 0:
+                g = math.gcd(g, n)
+        common_divisors = [d for d in range(2, 10) if g % d == 0]
         
         if common_divisors:
             return f"Harmonic resonance at multiples of {', '.join(map(str, common_divisors))}"
@@ -497,39 +734,20 @@ class HermeticSynthesis:
     
     def calculate_optimal_rhythm(self, geomantic, iching, tarot):
         """Calculate optimal rhythm for action"""
-        elements = {
-            geomantic.get('element', ''): 3,
-            iching['primary'].get('element', ''): 2,
-            tarot.get('element', ''): 1
-        }
-        
-        # Determine dominant element
-        fire_count = sum(1 for e in elements if 'Fire' in str(e))
-        water_count = sum(1 for e in elements if 'Water' in str(e))
-        air_count = sum(1 for e in elements if 'Air' in str(e))
-        earth_count = sum(1 for e in elements if 'Earth' in str(e))
-        
-        counts = {'Fire': fire_count, 'Water': water_count, 'Air': air_count, 'Earth': earth_count}
-        dominant = max(counts, key=counts.get)
-        
-        rhythms = {
-            'Fire': "Quick, decisive actions in 3-day cycles",
-            'Water': "Fluid, intuitive timing - follow emotional cues",
-            'Air': "Mental focus in morning, communication in afternoon",
-            'Earth': "Slow, steady progress with weekly checkpoints"
-        }
+        # Each distinct element label counts once, matched by name
+        labels = [str(e) for e in {
+            geomantic.get('element', ''),
+            iching['primary'].get('element', ''),
+            tarot.get('element', '')
+        }]
         
-        return rhythms.get(dominant, "Follow natural cycles and planetary timing")
+        # Determine dominant element; ties (and no match) go Fire > Water > Air > Earth
+        dominant = max(_RHYTHMS, key=lambda element: sum(element.value in label for label in labels))
+        return _RHYTHMS[dominant]
     
     def get_direction(self, element):
         """Get direction for element"""
-        directions = {
-            "Fire": "South",
-            "Water": "West",
-            "Air": "East",
-            "Earth": "North"
-        }
-        return directions.get(element, "Center")
+        return _DIRECTIONS.get(_as_element(element), "Center")
     
     def get_ritual_elements(self, geomantic, iching, tarot):
         """Get ritual elements for combined reading"""
@@ -584,16 +802,82 @@ class HermeticSynthesis:
     
     def get_planet_quality(self, planet):
         """Get quality description for a planet"""
-        qualities = {
-            "Sun": "Vitality, success, leadership",
-            "Moon": "Intuition, emotions, receptivity",
-            "Mercury": "Communication, intellect, travel",
-            "Venus": "Love, beauty, harmony",
-            "Mars": "Action, courage, conflict",
-            "Jupiter": "Expansion, luck, wisdom",
-            "Saturn": "Discipline, structure, karma"
-        }
-        return qualities.get(planet, "Neutral influence")
+        return _PLANET_QUALITIES.get(_as_planet(planet), "Neutral influence")
+
+def _with_names(table):
+    """Also key an enum-keyed table by member value, so str or enum is one lookup"""
+    return {**table, **{member.value: v for member, v in table.items()}}
+
+# Interpretation depth correspondence tables
+_PLANET_ESSENCES = _with_names({
+    Planet.SUN: "Vital consciousness, creative will",
+    Planet.MOON: "Receptive intuition, emotional wisdom",
+    Planet.MERCURY: "Adaptive intellect, communicative bridge",
+    Planet.VENUS: "Harmonizing love, aesthetic appreciation",
+    Planet.MARS: "Dynamic action, courageous initiative",
+    Planet.JUPITER: "Expansive wisdom, abundant growth",
+    Planet.SATURN: "Structural discipline, karmic lessons"
+})
+
+_ELEMENT_ESSENCES = _with_names({
+    Element.FIRE: "Transforming energy, purifying will",
+    Element.WATER: "Fluid emotion, intuitive depth",
+    Element.AIR: "Mental clarity, communicative flow",
+    Element.EARTH: "Manifesting stability, practical grounding"
+})
+
+_NUMERICAL_ARCHETYPES = {
+    0: "The Void - Infinite potential",
+    1: "The Magician - Conscious creation",
+    2: "The High Priestess - Intuitive wisdom",
+    3: "The Empress - Creative abundance",
+    4: "The Emperor - Structural authority",
+    5: "The Hierophant - Traditional wisdom",
+    6: "The Lovers - Harmonious choice",
+    7: "The Chariot - Directed will",
+    8: "Strength - Courageous mastery",
+    9: "The Hermit - Inner wisdom",
+    10: "Wheel of Fortune - Cyclical change",
+    11: "Justice - Balance and truth",
+    12: "The Hanged Man - Sacrificial wisdom",
+    13: "Death - Transformational ending",
+    14: "Temperance - Alchemical blending",
+    15: "The Devil - Material bondage"
+}
+
+def _classify_binary_pattern(binary_str):
+    """Describe the yin/yang shape of a binary string"""
+    if binary_str == binary_str[::-1]:
+        return "Palindrome symmetry - balanced energy"
+    elif '1111' in binary_str:
+        return "Strong yang emphasis"
+    elif '0000' in binary_str:
+        return "Strong yin emphasis"
+    else:
+        return "Dynamic interplay of yin and yang"
+
+# Pattern of every trigram/figure/hexagram string, so batch analysis is a dict hit
+_BINARY_PATTERNS = {b: _classify_binary_pattern(b) for b in _BIN2DEC}
+
+def _binary_pattern(binary_str):
+    """Describe the yin/yang shape of a binary string"""
+    pattern = _BINARY_PATTERNS.get(binary_str)
+    if pattern is None:
+        pattern = _classify_binary_pattern(binary_str)
+    return pattern
+
+@lru_cache(maxsize=256)
+def _pythagorean_value(binary_str):
+    """Digit-sum reduce a binary string's value and attach its meaning"""
+    decimal = _binary_to_decimal(binary_str)
+    while decimal > 9:
+        decimal = sum(int(d) for d in str(decimal))
+    return f"{decimal} - {_NUMBER_MEANINGS.get(decimal, 'Mystery')}"
+
+@lru_cache(maxsize=256)
+def _numerical_archetype(binary_str):
+    """Major Arcana archetype for a binary string's value"""
+    return _NUMERICAL_ARCHETYPES.get(_binary_to_decimal(binary_str), "Unique numerical signature")
 
 # ============ INTERPRETATION DEPTH SYSTEM ============
 
@@ -603,19 +887,19 @@ class InterpretationDepthSystem:
     DEPTH_LEVELS = {
         "standard": {
             "description": "Core meanings and basic synthesis",
-            "geomancy_fields": ["name", "binary", "meaning", "planet", "element"],
-            "iching_fields": ["number", "english", "chinese", "judgment_english"],
-            "tarot_fields": ["name", "suit", "meaning", "element"],
+            "geomancy_fields": frozenset({"name", "binary", "meaning", "planet", "element"}),
+            "iching_fields": frozenset({"number", "english", "chinese", "judgment_english"}),
+            "tarot_fields": frozenset({"name", "suit", "meaning", "element"}),
             "synthesis_type": "basic"
         },
         "detailed": {
             "description": "Extended interpretations with practical guidance",
-            "geomancy_fields": ["name", "binary", "meaning", "planet", "element", 
-                               "astrological", "essence", "practical_advice"],
-            "iching_fields": ["number", "english", "chinese", "judgment_english",
-                            "image", "lines_english", "changing_meaning"],
-            "tarot_fields": ["name", "suit", "meaning", "element", "planet",
-                           "upright_meaning", "reversed_meaning", "symbolism"],
+            "geomancy_fields": frozenset({"name", "binary", "meaning", "planet", "element", 
+                                          "astrological", "essence", "practical_advice"}),
+            "iching_fields": frozenset({"number", "english", "chinese", "judgment_english",
+                                        "image", "lines_english", "changing_meaning"}),
+            "tarot_fields": frozenset({"name", "suit", "meaning", "element", "planet",
+                                       "upright_meaning", "reversed_meaning", "symbolism"}),
             "synthesis_type": "hermetic"
         },
         "comprehensive": {
@@ -624,9 +908,9 @@ class InterpretationDepthSystem:
             "iching_fields": "all",
             "tarot_fields": "all",
             "synthesis_type": "hermetic_detailed",
-            "include": ["mathematical_analysis", "ogdoad_connections", 
-                       "hermetic_principles", "ritual_guidance", 
-                       "reflective_questions"]
+            "include": frozenset({"mathematical_analysis", "ogdoad_connections", 
+                                  "hermetic_principles", "ritual_guidance", 
+                                  "reflective_questions"})
         }
     }
     
@@ -648,17 +932,20 @@ class InterpretationDepthSystem:
         
         if level["geomancy_fields"] == "all":
             # Comprehensive interpretation
+            binary = figure.get('binary', '')
+            planet = figure.get('planet')
+            element = figure.get('element')
             interpretation = f"""
             🧿 GEOMANTIC FIGURE: {figure.get('name', 'Unknown')}
             {'═' * 60}
             
-            BINARY FOUNDATION: {figure.get('binary', '')}
-            • Decimal value: {self.binary_to_decimal(figure.get('binary', '0000'))}
-            • Binary pattern: {self.analyze_binary_pattern(figure.get('binary', ''))}
+            BINARY FOUNDATION: {binary}
+            • Decimal value: {self.binary_to_decimal(binary)}
+            • Binary pattern: {self.analyze_binary_pattern(binary)}
             
             HERMETIC CORRESPONDENCES:
-            • Planet: {figure.get('planet', 'Unknown')} - {self.get_planet_essence(figure.get('planet', ''))}
-            • Element: {figure.get('element', 'Unknown')} - {self.get_element_essence(figure.get('element', ''))}
+            • Planet: {'Unknown' if planet is None else planet} - {self.get_planet_essence(planet)}
+            • Element: {'Unknown' if element is None else element} - {self.get_element_essence(element)}
             
             PRACTICAL APPLICATION:
             
@@ -673,8 +960,8 @@ class InterpretationDepthSystem:
             • Challenge: {figure.get('challenge', 'Area for growth')}
             
             MATHEMATICAL SIGNIFICANCE:
-            • Pythagorean value: {self.calculate_pythagorean_value(figure.get('binary', ''))}
-            • Numerical archetype: {self.get_numerical_archetype(figure.get('binary', ''))}
+            • Pythagorean value: {self.calculate_pythagorean_value(binary)}
+            • Numerical archetype: {self.get_numerical_archetype(binary)}
             
             MEDITATION GUIDANCE:
             {figure.get('meditation', 'Contemplate the binary pattern and its geometrical form')}
@@ -695,6 +982,7 @@ class InterpretationDepthSystem:
         primary = iching.get('primary', {})
         
         if level["iching_fields"] == "all":
+            trigrams = iching.get('trigram_symbols', {})
             interpretation = f"""
             📜 I CHING HEXAGRAM: {primary.get('english', 'Unknown')}
             {'═' * 60}
@@ -704,8 +992,8 @@ class InterpretationDepthSystem:
             • Judgment: {primary.get('judgment_english', '')}
             
             TRIGRAM ANALYSIS:
-            • Lower: {iching.get('trigram_symbols', {}).get('lower', '?')}
-            • Upper: {iching.get('trigram_symbols', {}).get('upper', '?')}
+            • Lower: {trigrams.get('lower', '?')}
+            • Upper: {trigrams.get('upper', '?')}
             
             LINE INTERPRETATIONS:"""
             
@@ -766,197 +1054,183 @@ class InterpretationDepthSystem:
     
     def binary_to_decimal(self, binary_str):
         """Convert binary to decimal"""
-        try:
-            return int(binary_str, 2)
-        except:
-            return 0
+        return _binary_to_decimal(binary_str)
     
     def analyze_binary_pattern(self, binary_str):
         """Analyze binary pattern"""
-        if binary_str == binary_str[::-1]:
-            return "Palindrome symmetry - balanced energy"
-        elif '1111' in binary_str:
-            return "Strong yang emphasis"
-        elif '0000' in binary_str:
-            return "Strong yin emphasis"
-        else:
-            return "Dynamic interplay of yin and yang"
+        return _binary_pattern(binary_str)
     
     def get_planet_essence(self, planet):
         """Get planet essence"""
-        essences = {
-            "Sun": "Vital consciousness, creative will",
-            "Moon": "Receptive intuition, emotional wisdom",
-            "Mercury": "Adaptive intellect, communicative bridge",
-            "Venus": "Harmonizing love, aesthetic appreciation",
-            "Mars": "Dynamic action, courageous initiative",
-            "Jupiter": "Expansive wisdom, abundant growth",
-            "Saturn": "Structural discipline, karmic lessons"
-        }
-        return essences.get(planet, "Cosmic influence")
+        return _PLANET_ESSENCES.get(planet, "Cosmic influence")
     
     def get_element_essence(self, element):
         """Get element essence"""
-        essences = {
-            "Fire": "Transforming energy, purifying will",
-            "Water": "Fluid emotion, intuitive depth",
-            "Air": "Mental clarity, communicative flow",
-            "Earth": "Manifesting stability, practical grounding"
-        }
-        return essences.get(element, "Elemental force")
+        return _ELEMENT_ESSENCES.get(element, "Elemental force")
     
     def calculate_pythagorean_value(self, binary_str):
         """Calculate Pythagorean value"""
-        decimal = self.binary_to_decimal(binary_str)
-        while decimal > 9:
-            decimal = sum(int(d) for d in str(decimal))
-        return f"{decimal} - {self.get_number_meaning(decimal)}"
+        return _pythagorean_value(binary_str)
     
     def get_number_meaning(self, num):
         """Get meaning of number"""
-        meanings = {
-            1: "Unity, Beginning",
-            2: "Duality, Balance",
-            3: "Creativity, Trinity",
-            4: "Stability, Foundation",
-            5: "Change, Movement",
-            6: "Harmony, Balance",
-            7: "Wisdom, Mystery",
-            8: "Power, Manifestation",
-            9: "Completion, Wisdom"
-        }
-        return meanings.get(num, "Mystery")
+        return _NUMBER_MEANINGS.get(num, "Mystery")
     
     def get_numerical_archetype(self, binary_str):
         """Get numerical archetype"""
-        decimal = self.binary_to_decimal(binary_str)
-        archetypes = {
-            0: "The Void - Infinite potential",
-            1: "The Magician - Conscious creation",
-            2: "The High Priestess - Intuitive wisdom",
-            3: "The Empress - Creative abundance",
-            4: "The Emperor - Structural authority",
-            5: "The Hierophant - Traditional wisdom",
-            6: "The Lovers - Harmonious choice",
-            7: "The Chariot - Directed will",
-            8: "Strength - Courageous mastery",
-            9: "The Hermit - Inner wisdom",
-            10: "Wheel of Fortune - Cyclical change",
-            11: "Justice - Balance and truth",
-            12: "The Hanged Man - Sacrificial wisdom",
-            13: "Death - Transformational ending",
-            14: "Temperance - Alchemical blending",
-            15: "The Devil - Material bondage"
-        }
-        return archetypes.get(decimal, "Unique numerical signature")
+        return _numerical_archetype(binary_str)
 
 # ============ MAGIC SQUARE GENERATOR ============
+# Traditional planetary squares; immutable, shared by every reading
+_SATURN_SQUARE = (
+    (4, 9, 2),
+    (3, 5, 7),
+    (8, 1, 6)
+)
+
+_JUPITER_SQUARE = (
+    (4, 14, 15, 1),
+    (9, 7, 6, 12),
+    (5, 11, 10, 8),
+    (16, 2, 3, 13)
+)
+
+_MARS_SQUARE = (
+    (11, 24, 7, 20, 3),
+    (4, 12, 25, 8, 16),
+    (17, 5, 13, 21, 9),
+    (10, 18, 1, 14, 22),
+    (23, 6, 19, 2, 15)
+)
+
+_SUN_SQUARE = (
+    (6, 32, 3, 34, 35, 1),
+    (7, 11, 27, 28, 8, 30),
+    (19, 14, 16, 15, 23, 24),
+    (18, 20, 22, 21, 17, 13),
+    (25, 29, 10, 9, 26, 12),
+    (36, 5, 33, 4, 2, 31)
+)
+
+_VENUS_SQUARE = (
+    (22, 47, 16, 41, 10, 35, 4),
+    (5, 23, 48, 17, 42, 11, 29),
+    (30, 6, 24, 49, 18, 36, 12),
+    (13, 31, 7, 25, 43, 19, 37),
+    (38, 14, 32, 1, 26, 44, 20),
+    (21, 39, 8, 33, 2, 27, 45),
+    (46, 15, 40, 9, 34, 3, 28)
+)
+
+_MERCURY_SQUARE = (
+    (8, 58, 59, 5, 4, 62, 63, 1),
+    (49, 15, 14, 52, 53, 11, 10, 56),
+    (41, 23, 22, 44, 45, 19, 18, 48),
+    (32, 34, 35, 29, 28, 38, 39, 25),
+    (40, 26, 27, 37, 36, 30, 31, 33),
+    (17, 47, 46, 20, 21, 43, 42, 24),
+    (9, 55, 54, 12, 13, 51, 50, 16),
+    (64, 2, 3, 61, 60, 6, 7, 57)
+)
+
+_MOON_SQUARE = (
+    (37, 78, 29, 70, 21, 62, 13, 54, 5),
+    (6, 38, 79, 30, 71, 22, 63, 14, 46),
+    (47, 7, 39, 80, 31, 72, 23, 55, 15),
+    (16, 48, 8, 40, 81, 32, 64, 24, 56),
+    (57, 17, 49, 9, 41, 73, 33, 65, 25),
+    (26, 58, 18, 50, 1, 42, 74, 34, 66),
+    (67, 27, 59, 10, 51, 2, 43, 75, 35),
+    (36, 68, 19, 60, 11, 52, 3, 44, 76),
+    (77, 28, 69, 20, 61, 12, 53, 4, 45)
+)
+
+@lru_cache(maxsize=16)
+def _square_frame(size):
+    """Cell width and border lines for a size x size grid (same for every render)"""
+    # Calculate the width needed for each cell (based on largest number)
+    max_num = size * size
+    cell_width = len(str(max_num)) + 2  # +2 for padding
+    
+    bar = "─" * cell_width
+    top_border = "┌" + "┬".join([bar] * size) + "┐"
+    separator = "├" + "┼".join([bar] * size) + "┤"
+    bottom_border = "└" + "┴".join([bar] * size) + "┘"
+    return cell_width, top_border, separator, bottom_border
+
+@lru_cache(maxsize=16)
+def _custom_square(size):
+    """Rows of the custom square for a size; deterministic, so built once"""
+    if size % 2 == 1:
+        # Closed form of the Siamese walk (start top-middle, step up-right,
+        # drop down when blocked), so no cell-by-cell simulation is needed
+        shift = size // 2 + 1
+        # Both indices stay below 3 * size, so a repeated range wraps them
+        # without a modulo per cell
+        wrap = tuple(range(size)) * 3
+        return tuple(
+            tuple(size * wrap[i + j + shift] + wrap[i + 2 * j + 1] + 1
+                  for j in range(size))
+            for i in range(size)
+        )
+    # For even sizes, use simple pattern
+    return tuple(tuple(range(i * size + 1, (i + 1) * size + 1)) for i in range(size))
+
+_PLANET_SQUARES = {
+    Planet.SATURN: (_SATURN_SQUARE, 3),
+    Planet.JUPITER: (_JUPITER_SQUARE, 4),
+    Planet.MARS: (_MARS_SQUARE, 5),
+    Planet.SUN: (_SUN_SQUARE, 6),
+    Planet.VENUS: (_VENUS_SQUARE, 7),
+    Planet.MERCURY: (_MERCURY_SQUARE, 8),
+    Planet.MOON: (_MOON_SQUARE, 9)
+}
+
 class MagicSquareGenerator:
     """Generate traditional magic squares"""
     
+    __slots__ = ()
+    
     @staticmethod
     def generate_saturn_square():
         """3x3 Saturn square (Lo Shu)"""
-        return [
-            [4, 9, 2],
-            [3, 5, 7],
-            [8, 1, 6]
-        ]
+        return _SATURN_SQUARE
     
     @staticmethod
     def generate_jupiter_square():
         """4x4 Jupiter square"""
-        return [
-            [4, 14, 15, 1],
-            [9, 7, 6, 12],
-            [5, 11, 10, 8],
-            [16, 2, 3, 13]
-        ]
+        return _JUPITER_SQUARE
     
     @staticmethod
     def generate_mars_square():
         """5x5 Mars square"""
-        return [
-            [11, 24, 7, 20, 3],
-            [4, 12, 25, 8, 16],
-            [17, 5, 13, 21, 9],
-            [10, 18, 1, 14, 22],
-            [23, 6, 19, 2, 15]
-        ]
+        return _MARS_SQUARE
     
     @staticmethod
     def generate_sun_square():
         """6x6 Sun square"""
-        return [
-            [6, 32, 3, 34, 35, 1],
-            [7, 11, 27, 28, 8, 30],
-            [19, 14, 16, 15, 23, 24],
-            [18, 20, 22, 21, 17, 13],
-            [25, 29, 10, 9, 26, 12],
-            [36, 5, 33, 4, 2, 31]
-        ]
+        return _SUN_SQUARE
     
     @staticmethod
     def generate_venus_square():
         """7x7 Venus square"""
-        return [
-            [22, 47, 16, 41, 10, 35, 4],
-            [5, 23, 48, 17, 42, 11, 29],
-            [30, 6, 24, 49, 18, 36, 12],
-            [13, 31, 7, 25, 43, 19, 37],
-            [38, 14, 32, 1, 26, 44, 20],
-            [21, 39, 8, 33, 2, 27, 45],
-            [46, 15, 40, 9, 34, 3, 28]
-        ]
+        return _VENUS_SQUARE
     
     @staticmethod
     def generate_mercury_square():
         """8x8 Mercury square"""
-        return [
-            [8, 58, 59, 5, 4, 62, 63, 1],
-            [49, 15, 14, 52, 53, 11, 10, 56],
-            [41, 23, 22, 44, 45, 19, 18, 48],
-            [32, 34, 35, 29, 28, 38, 39, 25],
-            [40, 26, 27, 37, 36, 30, 31, 33],
-            [17, 47, 46, 20, 21, 43, 42, 24],
-            [9, 55, 54, 12, 13, 51, 50, 16],
-            [64, 2, 3, 61, 60, 6, 7, 57]
-        ]
+        return _MERCURY_SQUARE
     
     @staticmethod
     def generate_moon_square():
         """9x9 Moon square"""
-        return [
-            [37, 78, 29, 70, 21, 62, 13, 54, 5],
-            [6, 38, 79, 30, 71, 22, 63, 14, 46],
-            [47, 7, 39, 80, 31, 72, 23, 55, 15],
-            [16, 48, 8, 40, 81, 32, 64, 24, 56],
-            [57, 17, 49, 9, 41, 73, 33, 65, 25],
-            [26, 58, 18, 50, 1, 42, 74, 34, 66],
-            [67, 27, 59, 10, 51, 2, 43, 75, 35],
-            [36, 68, 19, 60, 11, 52, 3, 44, 76],
-            [77, 28, 69, 20, 61, 12, 53, 4, 45]
-        ]
+        return _MOON_SQUARE
     
     @staticmethod
     def get_square_by_planet(planet_name, size=None):
         """Get magic square for specific planet"""
-        planet_squares = {
-            "Saturn": (3, MagicSquareGenerator.generate_saturn_square),
-            "Jupiter": (4, MagicSquareGenerator.generate_jupiter_square),
-            "Mars": (5, MagicSquareGenerator.generate_mars_square),
-            "Sun": (6, MagicSquareGenerator.generate_sun_square),
-            "Venus": (7, MagicSquareGenerator.generate_venus_square),
-            "Mercury": (8, MagicSquareGenerator.generate_mercury_square),
-            "Moon": (9, MagicSquareGenerator.generate_moon_square)
-        }
-        
-        if planet_name in planet_squares:
-            size, generator = planet_squares[planet_name]
-            return generator(), size
-        else:
-            # Default to Saturn square
-            return MagicSquareGenerator.generate_saturn_square(), 3
+        # Default to Saturn square
+        return _PLANET_SQUARES.get(_as_planet(planet_name), (_SATURN_SQUARE, 3))
     
     @staticmethod
     def display_square(square, title=""):
@@ -965,93 +1239,189 @@ class MagicSquareGenerator:
             return ""
         
         size = len(square)
+        cell_width, top_border, separator, bottom_border = _square_frame(size)
         
-        # Calculate the width needed for each cell (based on largest number)
-        max_num = size * size
-        cell_width = len(str(max_num)) + 2  # +2 for padding
-        
-        output = f"\n🔢 {title} ({size}x{size} Magic Square):\n"
-        
-        # Build top border
-        top_border = "┌"
-        for col in range(size):
-            top_border += "─" * cell_width
-            if col < size - 1:
-                top_border += "┬"
-        top_border += "┐"
-        output += top_border + "\n"
-        
-        # Build rows
-        for row_idx, row in enumerate(square):
-            row_str = "│"
-            for num in row:
-                row_str += f"{num:^{cell_width}}│"
-            output += row_str + "\n"
-            
-            # Build separator between rows (not after last row)
-            if row_idx < size - 1:
-                separator = "├"
-                for col in range(size):
-                    separator += "─" * cell_width
-                    if col < size - 1:
-                        separator += "┼"
-                separator += "┤"
-                output += separator + "\n"
-        
-        # Build bottom border
-        bottom_border = "└"
-        for col in range(size):
-            bottom_border += "─" * cell_width
-            if col < size - 1:
-                bottom_border += "┴"
-        bottom_border += "┘"
-        output += bottom_border + "\n"
+        rows = [
+            "│" + "│".join([f"{num:^{cell_width}}" for num in row]) + "│"
+            for row in square
+        ]
         
         # Calculate magic constant
         magic_constant = size * (size**2 + 1) // 2
-        output += f"\n✨ Magic Constant: {magic_constant}\n"
         
-        return output
+        return "\n".join([
+            f"\n🔢 {title} ({size}x{size} Magic Square):",
+            top_border,
+            ("\n" + separator + "\n").join(rows),
+            bottom_border,
+            "",
+            f"✨ Magic Constant: {magic_constant}",
+            ""
+        ])
 
 # ============ READING HISTORY MANAGER ============
+# Histories holding unwritten entries, flushed together by one timer and one
+# atexit hook. Entries still buffered are lost if the process is killed
+# outright (e.g. SIGKILL)
+_DIRTY_HISTORIES = set()
+_flush_lock = threading.Lock()
+_flush_timer = None
+
+def _flush_histories():
+    """Write every history's buffered entries to its log"""
+    global _flush_timer
+    with _flush_lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+        dirty = list(_DIRTY_HISTORIES)
+    for history in dirty:
+        history.flush()
+
+def _schedule_flush(history, delay):
+    """Mark history as holding unwritten entries and arm the shared timer"""
+    global _flush_timer
+    with _flush_lock:
+        _DIRTY_HISTORIES.add(history)
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(delay, _flush_histories)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+atexit.register(_flush_histories)
+
 class ReadingHistory:
     """Manage reading history and archives"""
     
+    __slots__ = ("data_dir", "history_file", "log_file", "_triples", "_last_hash",
+                 "history", "_search_src", "_search_text", "_pending", "_lock")
+    
+    # New entries are written in batches: after this many, or this many seconds
+    FLUSH_EVERY = 10
+    FLUSH_INTERVAL = 5.0
+    
     def __init__(self, data_dir="readings"):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
         self.history_file = self.data_dir / "history.json"
+        # New readings are appended here; save_history folds them into history.json
+        self.log_file = self.data_dir / "history.ndjson"
+        # (geomantic, iching, tarot) -> strings shared by every entry with that triple
+        self._triples = {}
+        # Digest of the snapshot as last read/written, to skip identical rewrites
+        self._last_hash = None
+        # Other instances may hold unwritten entries (and their ids) for this log
+        _flush_histories()
         self.history = self.load_history()
+        self._search_src = None
+        self._search_text = []
+        # Entries added but not yet written to the log
+        self._pending = []
+        self._lock = threading.Lock()
     
     def load_history(self):
         """Load reading history from file"""
+        history = []
         if self.history_file.exists():
             try:
-                with open(self.history_file, 'r') as f:
-                    return json.load(f)
-            except:
-                return []
-        return []
+                with open(self.history_file, 'rb') as f:
+                    raw = f.read()
+                history = _json_loads(raw)
+                self._last_hash = self._digest(raw)
+            except (OSError, ValueError):
+                history = []
+        if self.log_file.exists():
+            with open(self.log_file, 'rb') as f:
+                for line in f:
+                    try:
+                        history.append(_json_loads(line))
+                    except ValueError:
+                        # Blank or partially written line (e.g. after a crash)
+                        continue
+        for entry in history:
+            if isinstance(entry, dict):
+                self._share_triple(entry)
+        return history
+    
+    @staticmethod
+    def _digest(data):
+        """Short content hash of serialized history"""
+        return hashlib.blake2b(data, digest_size=16).digest()
     
     def save_history(self):
         """Save reading history to file"""
-        with open(self.history_file, 'w') as f:
-            json.dump(self.history, f, indent=2)
+        tmp_file = self.history_file.with_suffix(".json.tmp")
+        with self._lock:
+            data = _json_bytes(self.history, indent=True)
+            digest = self._digest(data)
+            if digest != self._last_hash or not self.history_file.exists():
+                with open(tmp_file, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_file, self.history_file)
+                self._last_hash = digest
+            # Everything in the log (and the write buffer) is now in the snapshot
+            self._pending.clear()
+            if self.log_file.exists():
+                self.log_file.unlink()
+    
+    def append_history(self, entry):
+        """Queue an entry for the history log without rewriting the snapshot"""
+        with self._lock:
+            self._pending.append(entry)
+            flush_now = len(self._pending) >= self.FLUSH_EVERY
+        if flush_now:
+            self.flush()
+        else:
+            _schedule_flush(self, self.FLUSH_INTERVAL)
+    
+    def flush(self):
+        """Write queued entries to the history log"""
+        with self._lock:
+            if self._pending:
+                with open(self.log_file, 'ab') as f:
+                    f.write(b"".join(_json_bytes(entry) + b"\n" for entry in self._pending))
+                self._pending.clear()
+            with _flush_lock:
+                _DIRTY_HISTORIES.discard(self)
+    
+    def _share_triple(self, entry):
+        """Point entry's names and summary at the strings already held for its triple"""
+        key = (entry.get("geomantic", ""), entry.get("iching", ""), entry.get("tarot", ""))
+        shared = self._triples.get(key)
+        if shared is None:
+            self._triples[key] = (key, entry.get("summary", ""))
+            return
+        names, summary = shared
+        entry["geomantic"], entry["iching"], entry["tarot"] = names
+        if entry.get("summary") == summary:
+            entry["summary"] = summary
     
     def add_reading(self, reading_data):
         """Add a new reading to history"""
+        names = (
+            reading_data.get("geomantic", {}).get("name", ""),
+            reading_data.get("iching", {}).get("primary", {}).get("english", ""),
+            reading_data.get("tarot", {}).get("name", "")
+        )
+        shared = self._triples.get(names)
+        if shared is None:
+            # First reading with this triple; later repeats reuse its strings
+            shared = self._triples[names] = (names, self.create_summary(reading_data))
+        (geomantic, iching, tarot), summary = shared
         entry = {
             "id": len(self.history) + 1,
             "timestamp": datetime.now().isoformat(),
             "query": reading_data.get("query", ""),
-            "geomantic": reading_data.get("geomantic", {}).get("name", ""),
-            "iching": reading_data.get("iching", {}).get("primary", {}).get("english", ""),
-            "tarot": reading_data.get("tarot", {}).get("name", ""),
+            "geomantic": geomantic,
+            "iching": iching,
+            "tarot": tarot,
             "filename": reading_data.get("filename", ""),
-            "summary": self.create_summary(reading_data)
+            "summary": summary
         }
         self.history.append(entry)
-        self.save_history()
+        if self._search_src is self.history and len(self._search_text) == len(self.history) - 1:
+            self._search_text.append(self._search_key(entry))
+        self.append_history(entry)
         return entry
     
     def create_summary(self, reading_data):
@@ -1065,117 +1435,414 @@ class ReadingHistory:
         """Get recent readings"""
         return self.history[-limit:] if self.history else []
     
+    def clear_history(self):
+        """Remove all readings in place, so held references to history stay valid"""
+        with self._lock:
+            self.history.clear()
+            self._search_text.clear()
+        self.save_history()
+    
+    @staticmethod
+    def _search_key(reading):
+        """Lowercased searchable fields; NUL-separated so matches stay within a field"""
+        return "\0".join((reading["query"], reading["geomantic"], reading["summary"])).lower()
+    
+    def _search_index(self):
+        """Per-reading search keys, rebuilt if history was replaced or its length changed
+
+        Entries edited in place (history[i][...] = ...) are not detected.
+        """
+        if self._search_src is not self.history or len(self._search_text) != len(self.history):
+            self._search_src = self.history
+            self._search_text = [self._search_key(r) for r in self.history]
+        return self._search_text
+    
     def search_readings(self, keyword):
         """Search readings by keyword"""
-        results = []
-        for reading in self.history:
-            if (keyword.lower() in reading["query"].lower() or 
-                keyword.lower() in reading["geomantic"].lower() or
-                keyword.lower() in reading["summary"].lower()):
-                results.append(reading)
-        return results
+        keyword = keyword.lower()
+        return [
+            reading for reading, text in zip(self.history, self._search_index())
+            if keyword in text
+        ]
     
-    def export_to_json(self, filename="readings_export.json"):
-        """Export all readings to JSON file"""
-        export_data = {
-            "metadata": {
-                "export_date": datetime.now().isoformat(),
-                "total_readings": len(self.history),
-                "system": "quadruple.goddess"
-            },
-            "readings": self.history
-        }
+    def _export_chunks(self):
+        """Indented export JSON, one reading at a time
         
-        export_file = self.data_dir / filename
-        with open(export_file, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        Yields the same bytes as serializing {"metadata": ..., "readings": history}
+        in one go, without building the whole document in memory.
+        """
+        metadata = {
+            "export_date": datetime.now().isoformat(),
+            "total_readings": len(self.history),
+            "system": "quadruple.goddess"
+        }
+        # JSON strings never contain raw newlines, so re-indenting is a replace
+        yield b'{\n  "metadata": ' + _json_bytes(metadata, indent=True).replace(b"\n", b"\n  ")
+        if not self.history:
+            yield b',\n  "readings": []\n}'
+            return
         
-        return export_file
+        sep = b',\n  "readings": [\n    '
+        for reading in self.history:
+            yield sep + _json_bytes(reading, indent=True).replace(b"\n", b"\n    ")
+            sep = b",\n    "
+        yield b"\n  ]\n}"
     
-    def export_to_text(self, filename="readings_export.txt"):
-        """Export readings to text file"""
-        export_file = self.data_dir / filename
-        
-        with open(export_file, 'w') as f:
-            f.write("="*60 + "\n")
-            f.write("QUADRUPLE GODDESS READING ARCHIVE\n")
-            f.write(f"Export Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total Readings: {len(self.history)}\n")
-            f.write("="*60 + "\n\n")
-            
-            for i, reading in enumerate(self.history, 1):
-                f.write(f"READING #{i}\n")
-                f.write(f"Date: {reading['timestamp']}\n")
-                f.write(f"Query: {reading['query']}\n")
-                f.write(f"Summary: {reading['summary']}\n")
-                f.write(f"File: {reading['filename']}\n")
-                f.write("-"*40 + "\n\n")
-        
-        return export_file
-
-# ============ MAIN SYSTEM CLASS ============
-class QuadrupleGoddessSystem:
-    def __init__(self):
-        """Initialize the enhanced system"""
-        self.version = "3.5.0"
-        self.framework = "quadruple.goddess"
-        self.build_date = "2025-12-09"
-        
-        # Initialize subsystems
-        self.iching_caster = IChingCaster()
-        self.hour_calculator = PlanetaryHourCalculator()
-        self.magic_squares = MagicSquareGenerator()
-        self.history_manager = ReadingHistory()
-        self.hermetic_synthesis = HermeticSynthesis()
-        self.interpretation_depth = InterpretationDepthSystem()
+    def export_bytes(self):
+        """All readings with export metadata, serialized as indented JSON"""
+        return b"".join(self._export_chunks())
+    
+    def export_to_json(self, filename="readings_export.json"):
+        """Export all readings to JSON file"""
+        export_file = self.data_dir / filename
+        with open(export_file, 'wb') as f:
+            f.writelines(self._export_chunks())
         
-        # Load data
-        self.load_all_systems()
+        return export_file
     
-    def get_system_explanation(self, geomantic, iching, tarot, starting_system):
-        """Generate explanation based on starting system"""
-        explanations = {
-            "geomancy": f"""
+    def export_to_text(self, filename="readings_export.txt"):
+        """Export readings to text file"""
+        export_file = self.data_dir / filename
+        
+        lines = [
+            "="*60 + "\n",
+            "QUADRUPLE GODDESS READING ARCHIVE\n",
+            f"Export Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"Total Readings: {len(self.history)}\n",
+            "="*60 + "\n\n"
+        ]
+        rule = "-"*40 + "\n\n"
+        lines.extend(
+            f"READING #{i}\n"
+            f"Date: {reading['timestamp']}\n"
+            f"Query: {reading['query']}\n"
+            f"Summary: {reading['summary']}\n"
+            f"File: {reading['filename']}\n"
+            + rule
+            for i, reading in enumerate(self.history, 1)
+        )
+        
+        with open(export_file, 'w') as f:
+            f.write("".join(lines))
+        
+        return export_file
+
+# Starting-system explanations; only the selected one is formatted
+_SYSTEM_EXPLANATIONS = {
+    "geomancy": """
             🧿 STARTING WITH GEOMANCY:
-            This reading begins with the earthly foundation - the geomantic figure {geomantic['name']}.
+            This reading begins with the earthly foundation - the geomantic figure {geomantic[name]}.
             Geomancy represents the microcosm, the physical reality and practical situation.
             
-            Why start here? Because form precedes manifestation. {geomantic['name']} shows 
+            Why start here? Because form precedes manifestation. {geomantic[name]} shows 
             the current energetic pattern in material reality, which then connects to...
             """,
-            "iching": f"""
+    "iching": """
             📜 STARTING WITH I CHING:
-            This reading begins with cosmic principles - hexagram #{iching['primary']['number']}.
+            This reading begins with cosmic principles - hexagram #{iching[primary][number]}.
             I Ching represents the macrocosm, universal patterns and archetypal forces.
             
             Why start here? Because principle precedes form. The hexagram shows 
             the underlying cosmic pattern that manifests as earthly events.
             """,
-            "tarot": f"""
+    "tarot": """
             🃏 STARTING WITH TAROT:
-            This reading begins with archetypal psychology - the {tarot['name']} card.
+            This reading begins with archetypal psychology - the {tarot[name]} card.
             Tarot represents the mediating principle between heaven and earth.
             
             Why start here? Because psyche precedes experience. The card reveals 
             the psychological patterns shaping your perception of reality.
             """,
-            "jafr": f"""
+    "jafr": """
             📿 STARTING WITH JAFR:
-            This reading begins with magical action - the {geomantic.get('name', '')} talisman.
+            This reading begins with magical action - the {jafr_name} talisman.
             Jafr represents practical magic and ritual implementation.
             
             Why start here? Because intention precedes result. The talisman recipe 
             shows how to actively engage with the energies revealed.
             """,
-            "balanced": """
+    "balanced": """
             ⚖️ BALANCED PERSPECTIVE:
             All four systems are given equal weight in this synthesis.
             Geomancy (earth), I Ching (heaven), Tarot (mediation), and Jafr (action)
             together create a complete picture of the situation.
             """
-        }
+}
+
+# Reference tables shown from the system menu
+_PLANETARY_REFERENCE = {
+    "Sun": {"element": "Fire", "day": "Sunday", "metal": "Gold", "color": "Gold/Yellow"},
+    "Moon": {"element": "Water", "day": "Monday", "metal": "Silver", "color": "Silver/White"},
+    "Mercury": {"element": "Air", "day": "Wednesday", "metal": "Mercury/Quicksilver", "color": "Orange/Yellow"},
+    "Venus": {"element": "Water", "day": "Friday", "metal": "Copper", "color": "Green"},
+    "Mars": {"element": "Fire", "day": "Tuesday", "metal": "Iron", "color": "Red"},
+    "Jupiter": {"element": "Air", "day": "Thursday", "metal": "Tin", "color": "Blue/Purple"},
+    "Saturn": {"element": "Earth", "day": "Saturday", "metal": "Lead", "color": "Black/Indigo"}
+}
+
+_ELEMENTAL_REFERENCE = {
+    "Fire": {"direction": "South", "season": "Summer", "time": "Noon", "quality": "Hot/Dry"},
+    "Water": {"direction": "West", "season": "Autumn", "time": "Sunset", "quality": "Cold/Wet"},
+    "Air": {"direction": "East", "season": "Spring", "time": "Dawn", "quality": "Hot/Wet"},
+    "Earth": {"direction": "North", "season": "Winter", "time": "Midnight", "quality": "Cold/Dry"},
+    "Metal": {"direction": "West", "season": "Autumn", "planet": "Venus", "quality": "Contracting"},
+    "Wood": {"direction": "East", "season": "Spring", "planet": "Jupiter", "quality": "Expanding"}
+}
+
+# Both tables are fixed, so their display text is rendered once at import
+_PLANETARY_REFERENCE_TEXT = "\n".join(
+    ["\n🪐 PLANETARY CORRESPONDENCES", "="*60]
+    + [f"\n{planet}:\n"
+       f"   Element: {data['element']}\n"
+       f"   Day: {data['day']}\n"
+       f"   Metal: {data['metal']}\n"
+       f"   Color: {data['color']}"
+       for planet, data in _PLANETARY_REFERENCE.items()]
+)
+
+_ELEMENTAL_REFERENCE_TEXT = "\n".join(
+    ["\n🌟 ELEMENTAL CORRESPONDENCES", "="*60]
+    + [f"\n{element}:\n"
+       + "\n".join(f"   {key.capitalize()}: {value}" for key, value in data.items())
+       for element, data in _ELEMENTAL_REFERENCE.items()]
+)
+
+_KNOWN_NEW_MOON = date(2024, 1, 11)
+_LUNAR_CYCLE_DAYS = 29.53
+
+# The eight phases in cycle order, starting from the new moon
+_MOON_PHASES = (
+    "New Moon 🌑", "Waxing Crescent 🌒", "First Quarter 🌓", "Waxing Gibbous 🌔",
+    "Full Moon 🌕", "Waning Gibbous 🌖", "Last Quarter 🌗", "Waning Crescent 🌘"
+)
+
+@lru_cache(maxsize=1)
+def _moon_phase(day):
+    """Approximate moon phase name for a date (only changes once a day)"""
+    days_since = (day - _KNOWN_NEW_MOON).days
+    phase = (days_since % _LUNAR_CYCLE_DAYS) / _LUNAR_CYCLE_DAYS
+    # Each name covers the eighth of the cycle centred on its exact phase
+    return _MOON_PHASES[int(phase * 8 + 0.5) % 8]
+
+# Planetary hour display; the correspondence block never changes
+_PLANET_CORRESPONDENCES = {
+    "Sun": "Success, vitality, leadership",
+    "Moon": "Intuition, dreams, emotions",
+    "Mercury": "Communication, travel, intellect",
+    "Venus": "Love, beauty, harmony",
+    "Mars": "Action, courage, conflict",
+    "Jupiter": "Expansion, luck, wisdom",
+    "Saturn": "Discipline, boundaries, karma"
+}
+_PLANET_CORRESPONDENCES_TEXT = "\n".join(
+    ["\n✨ PLANETARY CORRESPONDENCES:"]
+    + [f"   • {planet}: {meaning}" for planet, meaning in _PLANET_CORRESPONDENCES.items()]
+)
+
+# Hexagram line art: yang (solid) and yin (broken)
+_LINE_SOLID = "━━━━━━━━━━━━━"
+_LINE_BROKEN = "━━━   ━━━━━"
+
+_TAROT_SUITS = ("wands", "cups", "swords", "pentacles")
+
+# Reference table renderers; QuadrupleGoddessSystem caches each result
+def _render_geomancy_reference(data):
+    """Geomancy figures reference table"""
+    lines = ["\n🧿 GEOMANCY FIGURES REFERENCE", "="*60]
+    for binary, figure in data.get("figures", {}).items():
+        lines.append(f"\n{binary}: {figure['name']}")
+        lines.append(f"   Planet: {figure['planet']}")
+        lines.append(f"   Element: {figure['element']}")
+        lines.append(f"   Meaning: {figure['meaning'][:80]}...")
+    return "\n".join(lines)
+
+def _render_iching_reference(data):
+    """I Ching hexagrams reference table"""
+    lines = ["\n📜 I CHING HEXAGRAMS REFERENCE", "="*60]
+    for binary, hexagram in data.get("hexagrams", {}).items():
+        lines.append(f"\n#{hexagram['number']}: {hexagram['english']} ({hexagram['chinese']})")
+        lines.append(f"   Binary: {binary}")
+        lines.append(f"   {hexagram['judgment_english'][:60]}...")
+    return "\n".join(lines)
+
+def _render_tarot_reference(data):
+    """Tarot reference: every Major Arcana card, the first three of each suit"""
+    lines = ["\n🃏 TAROT REFERENCE", "="*60, "\nMAJOR ARCANA:"]
+    lines.extend(
+        f"  {card['number']:2d}. {card['name']}: {card['meaning'][:40]}..."
+        for card in data.get("major_arcana", [])
+    )
+    
+    lines.append("\nMINOR ARCANA:")
+    minor = data.get("minor_arcana", {})
+    for suit in _TAROT_SUITS:
+        cards = minor.get(suit, [])
+        if cards:
+            lines.append(f"\n  {suit.upper()}:")
+            lines.extend(f"    {card['name']}" for card in cards[:3])
+    return "\n".join(lines)
+
+def _render_jafr_reference(data):
+    """Jafr correspondences reference table"""
+    lines = ["\n📿 JAFR CORRESPONDENCES", "="*60]
+    for figure, entry in data.items():
+        lines.append(f"\n{figure}:")
+        lines.append(f"   Letter: {entry['letter']} (Value: {entry['value']})")
+        lines.append(f"   Square: {entry['square']}")
+        lines.append(f"   Angel: {entry['angel']}")
+        lines.append(f"   Use: {entry['use'][:60]}...")
+    return "\n".join(lines)
+
+def _prepare_export_view(result):
+    """Flat, pre-truncated fields shared by the text and CSV exports"""
+    view = {}
+    for key, entry, name_field, meaning_field in (
+            ('geom', result['geomantic'], 'name', 'meaning'),
+            ('iching', result['iching']['primary'], 'english', 'judgment_english'),
+            ('tarot', result['tarot'], 'name', 'meaning')):
+        meaning = entry.get(meaning_field, '')[:200]
+        view[f'{key}_name'] = entry.get(name_field, '')
+        view[f'{key}_label'] = entry.get(name_field, 'Unknown')
+        view[f'{key}_meaning_200'] = meaning
+        view[f'{key}_meaning_100'] = meaning[:100]
+        view[f'{key}_element'] = entry.get('element', '')
+        view[f'{key}_planet'] = entry.get('planet', '')
+    return view
+
+_CELTIC_CROSS_POSITIONS = (
+    "1. Present Situation",
+    "2. Immediate Challenge",
+    "3. Distant Past",
+    "4. Recent Past",
+    "5. Best Outcome",
+    "6. Immediate Future",
+    "7. Self-Image",
+    "8. Environmental Factors",
+    "9. Hopes/Fears",
+    "10. Final Outcome"
+)
+
+_FALLBACK_TAROT_CARD = {
+    "name": "The Fool",
+    "number": 0,
+    "meaning": "New beginnings and unlimited potential.",
+    "element": "Air",
+    "planet": "Uranus",
+    "suit": "Major Arcana"
+}
+
+def _tarot_card(card, suit):
+    """Normalized drawn-card record for a tarot data entry"""
+    return {
+        "name": card.get("name", "Unknown"),
+        "number": card.get("number", 0),
+        "meaning": card.get("meaning", "No meaning available."),
+        "element": card.get("element", "Unknown"),
+        "planet": card.get("planet", "Unknown"),
+        "suit": suit
+    }
+
+# ============ MAIN SYSTEM CLASS ============
+class QuadrupleGoddessSystem:
+    __slots__ = ("version", "framework", "build_date",
+                 "iching_caster", "hour_calculator", "magic_squares", "history_manager",
+                 "hermetic_synthesis", "interpretation_depth",
+                 "geomancy_figures", "iching_hexagrams", "tarot_major", "jafr_correspondences",
+                 "_readings_dir", "_dirs_ready",
+                 "_geomantic_cache", "_hexagram_cache", "_tarot_deck_cache", "_planetary_cache",
+                 "_jafr_cache", "_reference_cache")
+    
+    # Data attribute -> (system, file); each file is parsed on first access
+    DATA_FILES = {
+        "geomancy_figures": ("geomancy", "data/geomancy.json"),
+        "iching_hexagrams": ("iching", "data/iching.json"),
+        "tarot_major": ("tarot", "data/tarot.json"),
+        "jafr_correspondences": ("jafr", "data/jafr.json")
+    }
+    
+    # Menu choice -> (label, method name, positional args)
+    READING_MENU = {
+        "1": ("🧿 Full Quadruple Reading", "run_full_reading_with_options", ()),
+        "2": ("🪙 I Ching Only (Coin Method)", "run_iching_reading", ("coins",)),
+        "3": ("🌿 I Ching Only (Yarrow Method)", "run_iching_reading", ("yarrow",)),
+        "4": ("🧿 Geomancy Only", "run_geomancy_only", ()),
+        "5": ("🃏 Tarot Only", "run_tarot_only", ()),
+        "6": ("📿 Jafr Talisman Generation", "run_jafr_talisman", ()),
+        "7": ("⏰ Check Planetary Hour", "display_planetary_hour", ()),
+        "8": ("🔢 Generate Magic Square", "generate_magic_square_menu", ())
+    }
+    
+    # Menu choice -> (label, method name, takes the reading result)
+    POST_READING_MENU = {
+        "1": ("🔄 Run another reading", "run_reading_menu", False),
+        "2": ("📊 View reading history", "view_reading_history", False),
+        "3": ("💾 Export reading to PDF/JSON", "export_reading", True),
+        "4": ("⏰ Check optimal timing for actions", "display_optimal_timing", True),
+        "5": ("🧿 Generate additional talismans", "generate_additional_talismans", True)
+    }
+    
+    # Menu choice -> (label, method name); each option prompts for its own input
+    HISTORY_MENU = {
+        "1": ("View detailed reading", "_history_view_detailed"),
+        "2": ("Search readings", "_history_search"),
+        "3": ("Export all readings", "_history_export"),
+        "4": ("Clear history", "_history_clear")
+    }
+    
+    # Menu choice -> (label, method name); each exporter takes the reading result
+    EXPORT_MENU = {
+        "1": ("JSON (full data)", "export_to_json"),
+        "2": ("Text (readable)", "export_to_text_file"),
+        "3": ("CSV (tabular data)", "export_to_csv"),
+        "4": ("All formats", "export_all_formats")
+    }
+    
+    def __init__(self):
+        """Initialize the enhanced system"""
+        self.version = "3.5.0"
+        self.framework = "quadruple.goddess"
+        self.build_date = "2025-12-09"
+        
+        # Initialize subsystems
+        self.iching_caster = IChingCaster()
+        self.hour_calculator = PlanetaryHourCalculator()
+        self.magic_squares = MagicSquareGenerator()
+        self.history_manager = ReadingHistory()
+        # Saved readings sit beside the history, which already created the directory
+        self._readings_dir = self.history_manager.data_dir
+        # Output directories already created this session
+        self._dirs_ready = set()
+        self.hermetic_synthesis = HermeticSynthesis()
+        self.interpretation_depth = InterpretationDepthSystem()
         
-        return explanations.get(starting_system, "")
+        # Data slots stay unset until first read (see __getattr__)
+        self._geomantic_cache = None
+        self._hexagram_cache = None
+        self._tarot_deck_cache = None
+        self._planetary_cache = None
+        self._jafr_cache = None
+        # Reference table kind -> (source data, rendered text)
+        self._reference_cache = {}
+    
+    def __getattr__(self, name):
+        """Load a data file the first time its (still unset) slot is read"""
+        if name not in QuadrupleGoddessSystem.DATA_FILES:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        self.load_system(*QuadrupleGoddessSystem.DATA_FILES[name])
+        return object.__getattribute__(self, name)
+    
+    def get_system_explanation(self, geomantic, iching, tarot, starting_system):
+        """Generate explanation based on starting system"""
+        template = _SYSTEM_EXPLANATIONS.get(starting_system)
+        if template is None:
+            return ""
+        
+        return template.format(
+            geomantic=geomantic,
+            iching=iching,
+            tarot=tarot,
+            jafr_name=geomantic.get('name', '')
+        )
     
     def run_full_reading_with_options(self):
         """Run full reading with configuration options"""
@@ -1269,7 +1936,7 @@ class QuadrupleGoddessSystem:
         tarot = self.draw_tarot_card()
         
         # 4. Planetary timing
-        planetary_hour = self.hour_calculator.calculate_current_planetary_hour()
+        planetary_hour = self._planetary_timing()[0]
         
         # 5. Magic square
         magic_square = self.get_magic_square_for_geomantic(geomantic)
@@ -1391,14 +2058,19 @@ class QuadrupleGoddessSystem:
     
     def enhanced_synthesis(self, geomantic, iching, tarot, planetary_hour):
         """Enhanced synthesis with timing recommendations"""
+        primary = iching['primary']
+        # First sentence only; partition stops at the first '.'
+        geo_first = geomantic['meaning'].partition('.')[0]
+        tarot_first = tarot['meaning'].partition('.')[0]
+        
         synthesis = f"""
         🌟 INTEGRATED SYNTHESIS WITH TIMING
         {'═' * 50}
         
         CORE INSIGHTS:
-        • 🧿 Geomancy: {geomantic['name']} - {geomantic['meaning'].split('.')[0]}
-        • 📜 I Ching: {iching['primary']['english']} - {iching['primary'].get('judgment_english', '')[:100]}...
-        • 🃏 Tarot: {tarot['name']} - {tarot['meaning'].split('.')[0]}
+        • 🧿 Geomancy: {geomantic['name']} - {geo_first}
+        • 📜 I Ching: {primary['english']} - {primary.get('judgment_english', '')[:100]}...
+        • 🃏 Tarot: {tarot['name']} - {tarot_first}
         
         TEMPORAL ALIGNMENT:
         • Current Planetary Hour: {planetary_hour['planet']}
@@ -1407,17 +2079,17 @@ class QuadrupleGoddessSystem:
         
         ELEMENTAL SYNERGY:
         • Geomancy: {geomantic.get('element', 'Unknown')}
-        • I Ching: {iching['primary'].get('element', 'Unknown')}
+        • I Ching: {primary.get('element', 'Unknown')}
         • Tarot: {tarot.get('element', 'Unknown')}
         
         PRACTICAL RECOMMENDATIONS:
         1. IMMEDIATE (Next 3 days):
-           • Focus on: {geomantic['meaning'].split('.')[0]}
+           • Focus on: {geo_first}
            • Avoid: {self.get_contraindication(geomantic)}
         
         2. SHORT-TERM (This week):
            • Develop: {tarot['name'].lower()} energy
-           • Cultivate: {iching['primary']['english'].lower()} mindset
+           • Cultivate: {primary['english'].lower()} mindset
         
         3. RITUAL SUPPORT:
            • Use talisman during {self.get_best_talisman_time(geomantic)}
@@ -1445,34 +2117,29 @@ class QuadrupleGoddessSystem:
     
     def load_data_from_files(self):
         """Load data from JSON files if available"""
-        data_files = {
-            "geomancy": "data/geomancy.json",
-            "iching": "data/iching.json",
-            "tarot": "data/tarot.json",
-            "jafr": "data/jafr.json"
-        }
-        
-        for system, filename in data_files.items():
-            try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                    if system == "geomancy":
-                        self.geomancy_figures = data
-                    elif system == "iching":
-                        self.iching_hexagrams = data
-                    elif system == "tarot":
-                        self.tarot_major = data
-                    elif system == "jafr":
-                        self.jafr_correspondences = data
-                    
-                    print(f"✓ Loaded {system} from {filename}")
-            except FileNotFoundError:
-                print(f"⚠️ {filename} not found, using default data")
-                self.load_default_data(system)
-            except Exception as e:
-                print(f"❌ Error loading {filename}: {e}")
-                self.load_default_data(system)
+        for system, filename in QuadrupleGoddessSystem.DATA_FILES.values():
+            self.load_system(system, filename)
+    
+    def load_system(self, system, filename):
+        """Load one system's data file, falling back to the defaults"""
+        try:
+            data = _read_json_file(filename)
+            
+            if system == "geomancy":
+                self.geomancy_figures = data
+            elif system == "iching":
+                self.iching_hexagrams = data
+            elif system == "tarot":
+                self.tarot_major = data
+            elif system == "jafr":
+                self.jafr_correspondences = data
+            # Success stays quiet: this runs mid-reading on first use
+        except FileNotFoundError:
+            print(f"⚠️ {filename} not found, using default data")
+            self.load_default_data(system)
+        except Exception as e:
+            print(f"❌ Error loading {filename}: {e}")
+            self.load_default_data(system)
     
     def load_default_data(self, system):
         """Load default data if files not found"""
@@ -1509,40 +2176,87 @@ class QuadrupleGoddessSystem:
     
     def generate_geomantic_figure(self):
         """Generate a random geomantic figure"""
-        # Generate 4 binary digits
-        binary_str = ''.join([str(random.randint(0, 1)) for _ in range(4)])
-        
-        # Look up figure in loaded data
-        figure = self.geomancy_figures.get("figures", {}).get(binary_str, {
-            "name": "Unknown",
-            "binary": binary_str,
-            "meaning": "No meaning available.",
-            "planet": "Moon",
-            "element": "Water",
-            "astrological": "Unknown"
-        })
+        return self._draw_geomantic()[1]
+    
+    def _draw_geomantic(self):
+        """(value, figure) for a random geomantic figure; value is its 4 bits as an int"""
+        # Generate 4 binary digits in one draw and look the figure up by value
+        _, displays, by_int = self._geomantic_tables()
+        value = random.getrandbits(4)
+        binary_str, figure = by_int[value]
+        
+        if figure is None:
+            figure = {
+                "name": "Unknown",
+                "binary": binary_str,
+                "meaning": "No meaning available.",
+                "planet": "Moon",
+                "element": "Water",
+                "astrological": "Unknown"
+            }
         
         # Add display info
-        figure["display"] = self.display_geomantic_figure(binary_str)
-        return figure
+        figure["display"] = displays[binary_str]
+        return value, figure
 
+    def _geomantic_tables(self):
+        """(names, displays, by_int) for the 16 figures, rebuilt if the figure data is replaced
+        
+        by_int[n] is (binary string, figure or None) for the figure whose bits read n.
+        """
+        data = self.geomancy_figures
+        if self._geomantic_cache is None or self._geomantic_cache[0] is not data:
+            figures = data.get("figures", {})
+            names = {b: figures.get(b, {}).get("name", "Unknown") for b in _GEOMANTIC_DOTS}
+            displays = {b: f"{names[b]}:\n{dots}" for b, dots in _GEOMANTIC_DOTS.items()}
+            by_int = tuple((b, figures.get(b)) for b in (f"{n:04b}" for n in range(16)))
+            self._geomantic_cache = (data, names, displays, by_int)
+        return self._geomantic_cache[1:]
+    
+    def _jafr_by_figure(self):
+        """Jafr record (or None) for each geomantic figure value 0-15
+        
+        Rebuilt if either the figure or the Jafr data is replaced.
+        """
+        figures, jafr = self.geomancy_figures, self.jafr_correspondences
+        cache = self._jafr_cache
+        if cache is None or cache[0] is not figures or cache[1] is not jafr:
+            names = self._geomantic_tables()[0]
+            by_int = tuple(jafr.get(names[f"{n:04b}"]) for n in range(16))
+            self._jafr_cache = (figures, jafr, by_int)
+        return self._jafr_cache[2]
+    
+    def _hexagram_index(self):
+        """64-entry table indexed by hexagram value, rebuilt if the hexagram data is replaced
+        
+        Each entry is (binary string, lower trigram, upper trigram, hexagram or None).
+        """
+        data = self.iching_hexagrams
+        if self._hexagram_cache is None or self._hexagram_cache[0] is not data:
+            hexagrams = data.get("hexagrams", {})
+            index = []
+            for n in range(64):
+                binary = f"{n:06b}"
+                index.append((binary, *_get_trigram_symbols(binary), hexagrams.get(binary)))
+            self._hexagram_cache = (data, tuple(index))
+        return self._hexagram_cache[1]
+    
     def binary_to_geomantic(self, binary_str):
         """Convert binary string to geomantic figure name"""
+        names = self._geomantic_tables()[0]
+        if binary_str in names:
+            return names[binary_str]
         figure = self.geomancy_figures.get("figures", {}).get(binary_str, {})
         return figure.get("name", "Unknown")
 
     def display_geomantic_figure(self, binary_str):
         """Create visual representation of geomantic figure"""
-        lines = []
-        for bit in binary_str:
-            if bit == '1':
-                lines.append("●●")
-            else:
-                lines.append("○ ○")
-        
-        display = "\n".join(lines)
+        displays = self._geomantic_tables()[1]
+        if binary_str in displays:
+            return displays[binary_str]
         
-        # Add name if available
+        # Not a 4-bit figure; draw it directly
+        display = "\n".join("●●" if bit == '1' else "○ ○" for bit in binary_str)
         figure = self.geomancy_figures.get("figures", {}).get(binary_str, {})
         name = figure.get("name", "Unknown")
         
@@ -1556,27 +2270,32 @@ class QuadrupleGoddessSystem:
             hexagram_lines, changing_lines = self.iching_caster.cast_yarrow_stalks()
         else:
             # Random method
-            hexagram_lines = [random.randint(0, 1) for _ in range(6)]
+            bits = random.getrandbits(6)
+            hexagram_lines = [(bits >> i) & 1 for i in range(6)]
             changing_lines = []
         
-        # Convert to binary string
         if len(hexagram_lines) < 6:
-            hexagram_lines.extend([random.randint(0, 1) for _ in range(6 - len(hexagram_lines))])
-        
-        hexagram_binary = ''.join(['1' if x == 1 else '0' for x in hexagram_lines])
-        
-        # Get trigram symbols
-        lower_trigram, upper_trigram = self.iching_caster.get_trigram_symbols(hexagram_binary)
-        
-        # Look up hexagram
-        hexagram_data = self.iching_hexagrams.get("hexagrams", {}).get(hexagram_binary, {
-            "number": 0,
-            "english": "Unknown",
-            "chinese": "?",
-            "judgment_english": "No data available.",
-            "element": "Unknown",
-            "planet": "Moon"
-        })
+            missing = 6 - len(hexagram_lines)
+            bits = random.getrandbits(missing)
+            hexagram_lines.extend((bits >> i) & 1 for i in range(missing))
+        
+        # Line 1 (the last entry) is the lowest bit of the hexagram value
+        hexagram_value = 0
+        for line in hexagram_lines:
+            hexagram_value = (hexagram_value << 1) | line
+        
+        index = self._hexagram_index()
+        hexagram_binary, lower_trigram, upper_trigram, hexagram_data = index[hexagram_value]
+        
+        if hexagram_data is None:
+            hexagram_data = {
+                "number": 0,
+                "english": "Unknown",
+                "chinese": "?",
+                "judgment_english": "No data available.",
+                "element": "Unknown",
+                "planet": "Moon"
+            }
         
         result = {
             "binary": hexagram_binary,
@@ -1591,19 +2310,19 @@ class QuadrupleGoddessSystem:
         
         # If there are changing lines, get secondary hexagram
         if changing_lines:
-            secondary_lines = hexagram_lines.copy()
+            # Line n is bit n-1, so every changing line flips in one XOR
+            changing_mask = 0
             for line_num in changing_lines:
-                idx = 6 - line_num
-                if 0 <= idx < len(secondary_lines):
-                    secondary_lines[idx] = 1 if secondary_lines[idx] == 0 else 0
+                if 1 <= line_num <= 6:
+                    changing_mask |= 1 << (line_num - 1)
             
-            secondary_binary = ''.join(['1' if x == 1 else '0' for x in secondary_lines])
-            secondary_lower, secondary_upper = self.iching_caster.get_trigram_symbols(secondary_binary)
+            _, secondary_lower, secondary_upper, secondary_data = index[hexagram_value ^ changing_mask]
             
-            secondary_data = self.iching_hexagrams.get("hexagrams", {}).get(secondary_binary, {
-                "english": "Unknown Secondary",
-                "judgment_english": "No data available."
-            })
+            if secondary_data is None:
+                secondary_data = {
+                    "english": "Unknown Secondary",
+                    "judgment_english": "No data available."
+                }
             result["secondary"] = secondary_data
             result["secondary_trigram_symbols"] = {
                 "lower": secondary_lower,
@@ -1616,112 +2335,98 @@ class QuadrupleGoddessSystem:
         """Display hexagram with trigram symbols"""
         binary = hexagram_data.get('binary', '000000')
         trigrams = hexagram_data.get('trigram_symbols', {})
-        number = hexagram_data.get('primary', {}).get('number', 0)
-        name = hexagram_data.get('primary', {}).get('english', 'Unknown')
+        primary = hexagram_data.get('primary', {})
+        number = primary.get('number', 0)
+        name = primary.get('english', 'Unknown')
         
         lower = trigrams.get('lower', '?')
         upper = trigrams.get('upper', '?')
         
-        # Build hexagram display
-        lines = binary
-        hex_display = ""
+        changing_lines = hexagram_data.get('changing_lines')
+        changing = frozenset(changing_lines or ())
         
-        # Show trigrams
-        hex_display += f"\n☯ Hexagram #{number}: {name}"
-        hex_display += f"\n   Lower Trigram: {lower}  |  Upper Trigram: {upper}"
-        hex_display += f"\n   Binary: {binary}"
+        # Show trigrams (each part becomes its own line)
+        parts = [
+            "",
+            f"☯ Hexagram #{number}: {name}",
+            f"   Lower Trigram: {lower}  |  Upper Trigram: {upper}",
+            f"   Binary: {binary}"
+        ]
         
         # Show changing lines if any
-        if hexagram_data.get('changing_lines'):
-            hex_display += f"\n   Changing Lines: {hexagram_data['changing_lines']}"
-            if hexagram_data.get('secondary'):
-                sec = hexagram_data['secondary']
+        if changing_lines:
+            parts.append(f"   Changing Lines: {changing_lines}")
+            sec = hexagram_data.get('secondary')
+            if sec:
                 sec_trigrams = hexagram_data.get('secondary_trigram_symbols', {})
-                hex_display += f"\n   Evolving to: #{sec.get('number', '?')} {sec.get('english', 'Unknown')}"
-                hex_display += f"\n   New Trigrams: {sec_trigrams.get('lower', '?')} | {sec_trigrams.get('upper', '?')}"
+                parts.append(f"   Evolving to: #{sec.get('number', '?')} {sec.get('english', 'Unknown')}")
+                parts.append(f"   New Trigrams: {sec_trigrams.get('lower', '?')} | {sec_trigrams.get('upper', '?')}")
         
         # Add visual representation of lines
-        hex_display += "\n\n   Hexagram Structure (Bottom to Top):"
+        parts.append("")
+        parts.append("   Hexagram Structure (Bottom to Top):")
         
         # I Ching lines are displayed from bottom (Line 1) to top (Line 6)
         for i in range(5, -1, -1):  # From 5 to 0 (bottom to top)
             line_num = 6 - i
-            bit = binary[i]
-            
-            if bit == '1':
-                line_display = "━━━━━━━━━━━━━"
-            else:
-                line_display = "━━━   ━━━━━"
+            line_display = _LINE_SOLID if binary[i] == '1' else _LINE_BROKEN
             
-            if hexagram_data.get('changing_lines') and (line_num) in hexagram_data['changing_lines']:
-                hex_display += f"\n   Line {line_num}: {line_display} ⚡ (changing)"
+            if line_num in changing:
+                parts.append(f"   Line {line_num}: {line_display} ⚡ (changing)")
             else:
-                hex_display += f"\n   Line {line_num}: {line_display}"
+                parts.append(f"   Line {line_num}: {line_display}")
         
-        return hex_display
+        return "\n".join(parts)
 
+    def _tarot_deck(self):
+        """(cards, names, cum_weights) matching draw odds, rebuilt if the tarot data is replaced"""
+        data = self.tarot_major
+        if self._tarot_deck_cache is None or self._tarot_deck_cache[0] is not data:
+            cards, weights = [], []
+            
+            # Half the draws go to the Major Arcana (all of them if it is empty)
+            major = data.get("major_arcana", [])
+            minor_share = 1.0
+            if major:
+                minor_share = 0.5
+                cards.extend(_tarot_card(card, "Major Arcana") for card in major)
+                weights.extend([0.5 / len(major)] * len(major))
+            
+            # The rest pick uniformly among the suits that have cards; only
+            # a deck with no minor cards at all draws the fallback card
+            minor = data.get("minor_arcana", {})
+            suits = [(suit, minor[suit]) for suit in _TAROT_SUITS if minor.get(suit)]
+            if suits:
+                share = minor_share / len(suits)
+                for suit, suit_cards in suits:
+                    cards.extend(_tarot_card(card, suit.capitalize()) for card in suit_cards)
+                    weights.extend([share / len(suit_cards)] * len(suit_cards))
+            else:
+                cards.append(_FALLBACK_TAROT_CARD)
+                weights.append(minor_share)
+            
+            names = tuple(card["name"] for card in cards)
+            self._tarot_deck_cache = (data, cards, names, list(accumulate(weights)))
+        return self._tarot_deck_cache[1:]
+    
     def draw_tarot_card(self):
         """Draw a random tarot card (Major or Minor Arcana)"""
-        # Determine if we draw from Major or Minor
-        if random.random() < 0.5:
-            cards = self.tarot_major.get("major_arcana", [])
-            if cards:
-                card = random.choice(cards)
-                return {
-                    "name": card.get("name", "Unknown"),
-                    "number": card.get("number", 0),
-                    "meaning": card.get("meaning", "No meaning available."),
-                    "element": card.get("element", "Unknown"),
-                    "planet": card.get("planet", "Unknown"),
-                    "suit": "Major Arcana"
-                }
-        
-        # Draw from Minor Arcana
-        suits = ["wands", "cups", "swords", "pentacles"]
-        suit = random.choice(suits)
-        cards = self.tarot_major.get("minor_arcana", {}).get(suit, [])
-        
-        if cards:
-            card = random.choice(cards)
-            return {
-                "name": card.get("name", "Unknown"),
-                "number": card.get("number", 0),
-                "meaning": card.get("meaning", "No meaning available."),
-                "element": card.get("element", "Unknown"),
-                "planet": card.get("planet", "Unknown"),
-                "suit": suit.capitalize()
-            }
-        
-        # Fallback
-        return {
-            "name": "The Fool",
-            "number": 0,
-            "meaning": "New beginnings and unlimited potential.",
-            "element": "Air",
-            "planet": "Uranus",
-            "suit": "Major Arcana"
-        }
+        return self.draw_tarot_cards(1)[0]
+    
+    def draw_tarot_cards(self, n):
+        """Draw n tarot cards (with replacement, like n single draws) in one call"""
+        cards = self._tarot_deck()[0]
+        return [dict(cards[i]) for i in self.draw_tarot_indices(n)]
+    
+    def draw_tarot_indices(self, n):
+        """Draw n deck positions; index the _tarot_deck() columns to read only what is shown"""
+        cards, _, cum_weights = self._tarot_deck()
+        return random.choices(range(len(cards)), cum_weights=cum_weights, k=n)
 
     def get_magic_square_for_geomantic(self, geomantic):
         """Get magic square for geomantic figure's planet"""
         planet_name = geomantic.get("planet", "Moon")
-        
-        if planet_name == "Saturn":
-            return self.magic_squares.generate_saturn_square()
-        elif planet_name == "Jupiter":
-            return self.magic_squares.generate_jupiter_square()
-        elif planet_name == "Mars":
-            return self.magic_squares.generate_mars_square()
-        elif planet_name == "Sun":
-            return self.magic_squares.generate_sun_square()
-        elif planet_name == "Venus":
-            return self.magic_squares.generate_venus_square()
-        elif planet_name == "Mercury":
-            return self.magic_squares.generate_mercury_square()
-        elif planet_name == "Moon":
-            return self.magic_squares.generate_moon_square()
-        else:
-            return self.magic_squares.generate_saturn_square()
+        return self.magic_squares.get_square_by_planet(planet_name)[0]
 
     def run_reading_menu(self):
         """Main reading menu with all options"""
@@ -1730,38 +2435,21 @@ class QuadrupleGoddessSystem:
             print("🔮 RUN DIVINATION READING")
             print("="*60)
             print("\nSelect Method:")
-            print("  1. 🧿 Full Quadruple Reading")
-            print("  2. 🪙 I Ching Only (Coin Method)")
-            print("  3. 🌿 I Ching Only (Yarrow Method)")
-            print("  4. 🧿 Geomancy Only")
-            print("  5. 🃏 Tarot Only")
-            print("  6. 📿 Jafr Talisman Generation")
-            print("  7. ⏰ Check Planetary Hour")
-            print("  8. 🔢 Generate Magic Square")
+            for key, (label, _, _) in self.READING_MENU.items():
+                print(f"  {key}. {label}")
             print("  9. 🔙 Back to Main Menu")
             
             choice = input("\nSelect option (1-9): ").strip()
             
-            if choice == "1":
-                self.run_full_reading_with_options()
-            elif choice == "2":
-                self.run_iching_reading(method="coins")
-            elif choice == "3":
-                self.run_iching_reading(method="yarrow")
-            elif choice == "4":
-                self.run_geomancy_only()
-            elif choice == "5":
-                self.run_tarot_only()
-            elif choice == "6":
-                self.run_jafr_talisman()
-            elif choice == "7":
-                self.display_planetary_hour()
-            elif choice == "8":
-                self.generate_magic_square_menu()
-            elif choice == "9":
+            if choice == "9":
                 return
-            else:
+            entry = self.READING_MENU.get(choice)
+            if entry is None:
                 print("Invalid choice.")
+                continue
+            
+            _, method, args = entry
+            getattr(self, method)(*args)
     
     def run_iching_reading(self, method="coins"):
         """Run I Ching reading only"""
@@ -1820,10 +2508,11 @@ class QuadrupleGoddessSystem:
         # Ask about saving
         save = input("\n💾 Save this reading? (y/n): ").strip().lower()
         if save == 'y':
+            now = datetime.now()
             reading_data = {
                 "query": query,
                 "geomantic": figure,
-                "filename": f"geomancy_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+                "filename": f"geomancy_{now.strftime('%Y%m%d_%H%M%S')}.json"
             }
             self.history_manager.add_reading(reading_data)
 
@@ -1844,7 +2533,7 @@ class QuadrupleGoddessSystem:
         choice = input("Select (1-3, default 1): ").strip() or "1"
         
         if choice == "2":
-            cards = [self.draw_tarot_card() for _ in range(3)]
+            cards = self.draw_tarot_cards(3)
             print("\n🔮 Three-Card Spread:")
             print("  1. Past: " + cards[0]['name'])
             print("  2. Present: " + cards[1]['name'])
@@ -1855,22 +2544,9 @@ class QuadrupleGoddessSystem:
                 print(f"   {card['meaning']}")
         elif choice == "3":
             print("\n🔮 Celtic Cross Spread (drawing 10 cards)...")
-            cards = [self.draw_tarot_card() for _ in range(10)]
-            positions = [
-                "1. Present Situation",
-                "2. Immediate Challenge",
-                "3. Distant Past",
-                "4. Recent Past",
-                "5. Best Outcome",
-                "6. Immediate Future",
-                "7. Self-Image",
-                "8. Environmental Factors",
-                "9. Hopes/Fears",
-                "10. Final Outcome"
-            ]
-            
-            for i, (pos, card) in enumerate(zip(positions, cards)):
-                print(f"{pos}: {card['name']}")
+            names = self._tarot_deck()[1]
+            indices = self.draw_tarot_indices(len(_CELTIC_CROSS_POSITIONS))
+            print("\n".join(f"{pos}: {names[i]}" for pos, i in zip(_CELTIC_CROSS_POSITIONS, indices)))
         else:
             card = self.draw_tarot_card()
             print(f"\n🔮 Card Drawn: {card['name']}")
@@ -1886,21 +2562,23 @@ class QuadrupleGoddessSystem:
         print("="*60)
         
         # Generate geomantic figure
-        figure = self.generate_geomantic_figure()
+        value, figure = self._draw_geomantic()
         figure_name = figure['name']
         
         print(f"\n🧿 Base Geomantic Figure: {figure_name}")
         print(f"   {figure['meaning'][:100]}...")
         
-        # Get Jafr correspondence
-        jafr_data = self.jafr_correspondences.get(figure_name, {
-            "letter": "Unknown",
-            "value": 0,
-            "square": "3×3 Saturn",
-            "angel": "Unknown",
-            "divine_name": "Unknown",
-            "use": "No specific use available."
-        })
+        # Get Jafr correspondence straight from the figure's bits
+        jafr_data = self._jafr_by_figure()[value]
+        if jafr_data is None:
+            jafr_data = {
+                "letter": "Unknown",
+                "value": 0,
+                "square": "3×3 Saturn",
+                "angel": "Unknown",
+                "divine_name": "Unknown",
+                "use": "No specific use available."
+            }
         
         print(f"\n📜 Jafr Correspondences:")
         print(f"   Arabic Letter: {jafr_data['letter']}")
@@ -1911,45 +2589,49 @@ class QuadrupleGoddessSystem:
         print(f"\n🎯 Primary Use: {jafr_data['use']}")
         
         # Generate timing
-        planetary_hour = self.hour_calculator.calculate_current_planetary_hour()
+        planetary_hour = self._planetary_timing()[0]
         print(f"\n⏰ Current Timing:")
         print(f"   Planetary Hour: {planetary_hour['planet']}")
         print(f"   Hour Type: {'Day' if planetary_hour['is_daytime'] else 'Night'}")
 
+    def _planetary_timing(self, now=None):
+        """(current hour, schedule), recomputed at most once per clock minute"""
+        if now is None:
+            now = datetime.now()
+        key = now.replace(second=0, microsecond=0)
+        if self._planetary_cache is None or self._planetary_cache[0] != key:
+            # The shared read-only schedule; it is only displayed from here
+            self._planetary_cache = (key, _calculate_current_planetary_hour(now),
+                                     _build_schedule(now.weekday()))
+        _, current, schedule = self._planetary_cache
+        return dict(current), schedule
+
     def display_planetary_hour(self):
         """Display current planetary hour and schedule"""
-        current = self.hour_calculator.calculate_current_planetary_hour()
-        
-        print("\n" + "="*60)
-        print("⏰ PLANETARY HOUR INFORMATION")
-        print("="*60)
-        
-        print(f"\n🪐 CURRENT PLANETARY HOUR:")
-        print(f"   • Planet: {current['planet']}")
-        print(f"   • Hour: {current['hour_number']} of {current['is_daytime'] and 'day' or 'night'}")
-        print(f"   • Time: {datetime.now().strftime('%H:%M')}")
-        
-        print(f"\n📅 TODAY'S PLANETARY HOUR SCHEDULE:")
-        schedule = self.hour_calculator.get_planetary_hour_schedule()
-        
-        for hour in schedule[:6]:
-            print(f"   {hour['hour']:2d}. {hour['planet']:8s} ({hour['type']})")
-        
-        print("   ...")
+        now = datetime.now()
+        current, schedule = self._planetary_timing(now)
         
-        print(f"\n✨ PLANETARY CORRESPONDENCES:")
-        planet_correspondences = {
-            "Sun": "Success, vitality, leadership",
-            "Moon": "Intuition, dreams, emotions",
-            "Mercury": "Communication, travel, intellect",
-            "Venus": "Love, beauty, harmony",
-            "Mars": "Action, courage, conflict",
-            "Jupiter": "Expansion, luck, wisdom",
-            "Saturn": "Discipline, boundaries, karma"
-        }
+        lines = [
+            "\n" + "="*60,
+            "⏰ PLANETARY HOUR INFORMATION",
+            "="*60,
+            
+            f"\n🪐 CURRENT PLANETARY HOUR:",
+            f"   • Planet: {current['planet']}",
+            f"   • Hour: {current['hour_number']} of {current['is_daytime'] and 'day' or 'night'}",
+            f"   • Time: {now.strftime('%H:%M')}",
+            
+            f"\n📅 TODAY'S PLANETARY HOUR SCHEDULE:"
+        ]
+        lines.extend(
+            f"   {hour['hour']:2d}. {hour['planet']:8s} ({hour['type']})"
+            for hour in schedule[:6]
+        )
+        lines.append("   ...")
+        lines.append(_PLANET_CORRESPONDENCES_TEXT)
         
-        for planet, meaning in planet_correspondences.items():
-            print(f"   • {planet}: {meaning}")
+        # One write for the whole panel
+        print("\n".join(lines))
     
     def generate_magic_square_menu(self):
         """Menu for generating magic squares"""
@@ -1958,11 +2640,11 @@ class QuadrupleGoddessSystem:
         print("="*60)
         
         print("\nSelect Planet:")
-        planets = ["Saturn", "Jupiter", "Mars", "Sun", "Venus", "Mercury", "Moon"]
+        # Menu order follows _PLANET_SQUARES (Saturn 3x3 ... Moon 9x9)
+        planets = [planet.value for planet in _PLANET_SQUARES]
         
-        for i, planet in enumerate(planets, 1):
-            sizes = {"Saturn": 3, "Jupiter": 4, "Mars": 5, "Sun": 6, "Venus": 7, "Mercury": 8, "Moon": 9}
-            print(f"  {i}. {planet} ({sizes[planet]}x{sizes[planet]})")
+        for i, (planet, (_, size)) in enumerate(_PLANET_SQUARES.items(), 1):
+            print(f"  {i}. {planet.value} ({size}x{size})")
         
         print("  8. Custom size (3-9)")
         
@@ -2005,14 +2687,15 @@ class QuadrupleGoddessSystem:
     def save_enhanced_reading(self, geomantic, iching, tarot, jafr_recipe, 
                               planetary_hour, magic_square, synthesis, query):
         """Save enhanced reading with all data"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"readings/enhanced_reading_{timestamp}.json"
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        filename = str(self._readings_dir / f"enhanced_reading_{timestamp}.json")
         
         data = {
             "metadata": {
                 "system": self.framework,
                 "version": self.version,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "query": query
             },
             "geomancy": geomantic,
@@ -2028,12 +2711,9 @@ class QuadrupleGoddessSystem:
             "recommendations": self.generate_recommendations(geomantic, iching, tarot)
         }
         
-        # Ensure directory exists
-        Path("readings").mkdir(exist_ok=True)
-        
         # Save as JSON
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(_json_bytes(data, indent=True))
         
         # Also save as text for readability
         text_filename = filename.replace('.json', '.txt')
@@ -2043,44 +2723,55 @@ class QuadrupleGoddessSystem:
     
     def save_reading_as_text(self, filename, data):
         """Save reading as human-readable text"""
+        meta = data['metadata']
+        geo = data['geomancy']
+        ich = data['iching']['primary']
+        tar = data['tarot']
+        tim = data['planetary_timing']
+        size = data['magic_square']['size']
+        
+        lines = [
+            "="*60 + "\n",
+            "QUADRUPLE GODDESS - ENHANCED READING\n",
+            "="*60 + "\n\n",
+            
+            f"Date: {meta['timestamp']}\n",
+            f"Query: {meta['query']}\n\n",
+            
+            "🧿 GEOMANCY:\n",
+            f"  Figure: {geo['name']}\n",
+            f"  Meaning: {geo['meaning']}\n",
+            f"  Planet: {geo['planet']}\n",
+            f"  Element: {geo['element']}\n\n",
+            
+            "📜 I CHING:\n",
+            f"  Hexagram: {ich['english']}\n",
+            f"  Number: #{ich['number']}\n",
+            f"  Judgment: {ich['judgment_english']}\n\n",
+            
+            "🃏 TAROT:\n",
+            f"  Card: {tar['name']}\n",
+            f"  Suit: {tar['suit']}\n",
+            f"  Meaning: {tar['meaning']}\n\n",
+            
+            "⏰ TIMING:\n",
+            f"  Planetary Hour: {tim['planet']}\n",
+            f"  Hour Number: {tim['hour_number']}\n",
+            f"  Time of Day: {'Day' if tim['is_daytime'] else 'Night'}\n\n",
+            
+            "🔢 MAGIC SQUARE:\n",
+            f"  Size: {size}x{size}\n\n",
+            
+            "📝 SYNTHESIS:\n",
+            data['synthesis']
+        ]
+        
+        if data.get('jafr_recipe'):
+            lines.append("\n\n🧿 TALISMAN RECIPE:\n")
+            lines.append(data['jafr_recipe'])
+        
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write("="*60 + "\n")
-            f.write("QUADRUPLE GODDESS - ENHANCED READING\n")
-            f.write("="*60 + "\n\n")
-            
-            f.write(f"Date: {data['metadata']['timestamp']}\n")
-            f.write(f"Query: {data['metadata']['query']}\n\n")
-            
-            f.write("🧿 GEOMANCY:\n")
-            f.write(f"  Figure: {data['geomancy']['name']}\n")
-            f.write(f"  Meaning: {data['geomancy']['meaning']}\n")
-            f.write(f"  Planet: {data['geomancy']['planet']}\n")
-            f.write(f"  Element: {data['geomancy']['element']}\n\n")
-            
-            f.write("📜 I CHING:\n")
-            f.write(f"  Hexagram: {data['iching']['primary']['english']}\n")
-            f.write(f"  Number: #{data['iching']['primary']['number']}\n")
-            f.write(f"  Judgment: {data['iching']['primary']['judgment_english']}\n\n")
-            
-            f.write("🃏 TAROT:\n")
-            f.write(f"  Card: {data['tarot']['name']}\n")
-            f.write(f"  Suit: {data['tarot']['suit']}\n")
-            f.write(f"  Meaning: {data['tarot']['meaning']}\n\n")
-            
-            f.write("⏰ TIMING:\n")
-            f.write(f"  Planetary Hour: {data['planetary_timing']['planet']}\n")
-            f.write(f"  Hour Number: {data['planetary_timing']['hour_number']}\n")
-            f.write(f"  Time of Day: {'Day' if data['planetary_timing']['is_daytime'] else 'Night'}\n\n")
-            
-            f.write("🔢 MAGIC SQUARE:\n")
-            f.write(f"  Size: {data['magic_square']['size']}x{data['magic_square']['size']}\n\n")
-            
-            f.write("📝 SYNTHESIS:\n")
-            f.write(data['synthesis'])
-            
-            if data.get('jafr_recipe'):
-                f.write("\n\n🧿 TALISMAN RECIPE:\n")
-                f.write(data['jafr_recipe'])
+            f.write("".join(lines))
     
     def post_reading_options(self, result):
         """Display options after completing a reading"""
@@ -2090,34 +2781,33 @@ class QuadrupleGoddessSystem:
         
         while True:
             print("\nSelect option:")
-            print("  1. 🔄 Run another reading")
-            print("  2. 📊 View reading history")
-            print("  3. 💾 Export reading to PDF/JSON")
-            print("  4. ⏰ Check optimal timing for actions")
-            print("  5. 🧿 Generate additional talismans")
+            for key, (label, _, _) in self.POST_READING_MENU.items():
+                print(f"  {key}. {label}")
             print("  6. 🔙 Return to main menu")
             print("  7. 🚪 Exit program")
             
             choice = input("\nSelect (1-7): ").strip()
             
-            if choice == "1":
-                self.run_reading_menu()
-                break
-            elif choice == "2":
-                self.view_reading_history()
-            elif choice == "3":
-                self.export_reading(result)
-            elif choice == "4":
-                self.display_optimal_timing(result)
-            elif choice == "5":
-                self.generate_additional_talismans(result)
-            elif choice == "6":
+            if choice == "6":
                 return
-            elif choice == "7":
+            if choice == "7":
                 print("\n✨ Thank you for using Quadruple Goddess!")
                 sys.exit(0)
-            else:
+            entry = self.POST_READING_MENU.get(choice)
+            if entry is None:
                 print("Invalid choice.")
+                continue
+            
+            _, method, takes_result = entry
+            handler = getattr(self, method)
+            if takes_result:
+                handler(result)
+            else:
+                handler()
+            
+            # Another reading runs its own menu loop; don't come back here
+            if choice == "1":
+                break
     
     def view_reading_history(self):
         """View and manage reading history"""
@@ -2138,37 +2828,45 @@ class QuadrupleGoddessSystem:
             print(f"   File: {reading['filename']}")
         
         print("\nOptions:")
-        print("  1. View detailed reading")
-        print("  2. Search readings")
-        print("  3. Export all readings")
-        print("  4. Clear history")
+        for key, (label, _) in self.HISTORY_MENU.items():
+            print(f"  {key}. {label}")
         print("  5. Back")
         
         choice = input("\nSelect (1-5): ").strip()
         
-        if choice == "1":
-            reading_id = input("Enter reading #: ").strip()
-            self.view_detailed_reading(reading_id)
-        elif choice == "2":
-            keyword = input("Search keyword: ").strip()
-            results = self.history_manager.search_readings(keyword)
-            print(f"\n🔍 Found {len(results)} results:")
-            for r in results:
-                print(f"  #{r['id']}: {r['query'][:40]}...")
-        elif choice == "3":
-            format_choice = input("Export format (json/txt/both): ").strip().lower()
-            if format_choice in ['json', 'both']:
-                file = self.history_manager.export_to_json()
-                print(f"✓ Exported to JSON: {file}")
-            if format_choice in ['txt', 'both']:
-                file = self.history_manager.export_to_text()
-                print(f"✓ Exported to text: {file}")
-        elif choice == "4":
-            confirm = input("Clear all history? (type 'yes' to confirm): ").strip()
-            if confirm == 'yes':
-                self.history_manager.history = []
-                self.history_manager.save_history()
-                print("History cleared.")
+        entry = self.HISTORY_MENU.get(choice)
+        if entry is not None:
+            getattr(self, entry[1])()
+    
+    def _history_view_detailed(self):
+        """Prompt for a reading number and show it"""
+        reading_id = input("Enter reading #: ").strip()
+        self.view_detailed_reading(reading_id)
+    
+    def _history_search(self):
+        """Prompt for a keyword and list matching readings"""
+        keyword = input("Search keyword: ").strip()
+        results = self.history_manager.search_readings(keyword)
+        print(f"\n🔍 Found {len(results)} results:")
+        for r in results:
+            print(f"  #{r['id']}: {r['query'][:40]}...")
+    
+    def _history_export(self):
+        """Prompt for a format and export the whole history"""
+        format_choice = input("Export format (json/txt/both): ").strip().lower()
+        if format_choice in ['json', 'both']:
+            file = self.history_manager.export_to_json()
+            print(f"✓ Exported to JSON: {file}")
+        if format_choice in ['txt', 'both']:
+            file = self.history_manager.export_to_text()
+            print(f"✓ Exported to text: {file}")
+    
+    def _history_clear(self):
+        """Clear the history after confirmation"""
+        confirm = input("Clear all history? (type 'yes' to confirm): ").strip()
+        if confirm == 'yes':
+            self.history_manager.clear_history()
+            print("History cleared.")
     
     def view_detailed_reading(self, reading_id):
         """View detailed reading by ID"""
@@ -2188,10 +2886,9 @@ class QuadrupleGoddessSystem:
             # Try to load the actual reading file
             if reading.get('filename'):
                 try:
-                    with open(reading['filename'], 'r') as f:
-                        data = json.load(f)
-                        print("\n📊 Full Data:")
-                        print(json.dumps(data, indent=2))
+                    data = _read_json_file(reading['filename'])
+                    print("\n📊 Full Data:")
+                    print(_json_bytes(data, indent=True).decode("utf-8"))
                 except:
                     print("\n⚠️ Could not load reading file")
         except:
@@ -2203,92 +2900,96 @@ class QuadrupleGoddessSystem:
         print("="*60)
         
         print("\nSelect format:")
-        print("  1. JSON (full data)")
-        print("  2. Text (readable)")
-        print("  3. CSV (tabular data)")
-        print("  4. Back")
+        for key, (label, _) in self.EXPORT_MENU.items():
+            print(f"  {key}. {label}")
+        print("  5. Back")
         
-        choice = input("\nSelect (1-4): ").strip()
+        choice = input("\nSelect (1-5): ").strip()
         
-        if choice == "1":
-            self.export_to_json(result)
-        elif choice == "2":
-            self.export_to_text_file(result)
-        elif choice == "3":
-            self.export_to_csv(result)
-        elif choice == "4":
+        if choice == "5":
             return
-        else:
+        entry = self.EXPORT_MENU.get(choice)
+        if entry is None:
             print("Invalid choice")
+            return
+        getattr(self, entry[1])(result)
+    
+    def _ensure_dir(self, path):
+        """Create an output directory the first time it is used this session"""
+        if path not in self._dirs_ready:
+            Path(path).mkdir(parents=True, exist_ok=True)
+            self._dirs_ready.add(path)
+        return path
     
-    def export_to_json(self, result):
+    def export_all_formats(self, result):
+        """Export reading as JSON, text and CSV sharing one timestamp"""
+        now = datetime.now()
+        view = _prepare_export_view(result)
+        self.export_to_json(result, now)
+        self.export_to_text_file(result, now, view)
+        self.export_to_csv(result, now, view)
+    
+    def export_to_json(self, result, now=None):
         """Export reading to JSON"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"exports/reading_{timestamp}.json"
-        
-        Path("exports").mkdir(exist_ok=True)
+        timestamp = (now or datetime.now()).strftime("%Y%m%d_%H%M%S")
+        filename = f"{self._ensure_dir('exports')}/reading_{timestamp}.json"
         
-        with open(filename, 'w') as f:
-            json.dump(result, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(_json_bytes(result, indent=True))
         
         print(f"✓ Exported to JSON: {filename}")
     
-    def export_to_text_file(self, result):
+    def export_to_text_file(self, result, now=None, view=None):
         """Export reading to text file"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"exports/reading_{timestamp}.txt"
-        
-        Path("exports").mkdir(exist_ok=True)
+        now = now or datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        filename = f"{self._ensure_dir('exports')}/reading_{timestamp}.txt"
+        v = view or _prepare_export_view(result)
+        
+        lines = [
+            "="*60 + "\n",
+            "QUADRUPLE GODDESS READING\n",
+            "="*60 + "\n\n",
+            
+            f"Date: {now.isoformat()}\n",
+            f"Query: {result.get('query', '')}\n\n",
+            
+            "🧿 GEOMANCY:\n",
+            f"  Figure: {v['geom_label']}\n",
+            f"  Meaning: {v['geom_meaning_200']}...\n\n",
+            
+            "📜 I CHING:\n",
+            f"  Hexagram: {v['iching_label']}\n",
+            f"  Judgment: {v['iching_meaning_200']}...\n\n",
+            
+            "🃏 TAROT:\n",
+            f"  Card: {v['tarot_label']}\n",
+            f"  Meaning: {v['tarot_meaning_200']}...\n\n"
+        ]
         
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write("="*60 + "\n")
-            f.write("QUADRUPLE GODDESS READING\n")
-            f.write("="*60 + "\n\n")
-            
-            f.write(f"Date: {datetime.now().isoformat()}\n")
-            f.write(f"Query: {result.get('query', '')}\n\n")
-            
-            f.write("🧿 GEOMANCY:\n")
-            f.write(f"  Figure: {result['geomantic'].get('name', 'Unknown')}\n")
-            f.write(f"  Meaning: {result['geomantic'].get('meaning', '')[:200]}...\n\n")
-            
-            f.write("📜 I CHING:\n")
-            f.write(f"  Hexagram: {result['iching']['primary'].get('english', 'Unknown')}\n")
-            f.write(f"  Judgment: {result['iching']['primary'].get('judgment_english', '')[:200]}...\n\n")
-            
-            f.write("🃏 TAROT:\n")
-            f.write(f"  Card: {result['tarot'].get('name', 'Unknown')}\n")
-            f.write(f"  Meaning: {result['tarot'].get('meaning', '')[:200]}...\n\n")
+            f.write("".join(lines))
         
         print(f"✓ Exported to text: {filename}")
     
-    def export_to_csv(self, result):
+    def export_to_csv(self, result, now=None, view=None):
         """Export reading to CSV"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"exports/reading_{timestamp}.csv"
-        
-        Path("exports").mkdir(exist_ok=True)
-        
-        import csv
+        timestamp = (now or datetime.now()).strftime("%Y%m%d_%H%M%S")
+        filename = f"{self._ensure_dir('exports')}/reading_{timestamp}.csv"
+        v = view or _prepare_export_view(result)
+        
+        rows = [['System', 'Name', 'Meaning', 'Element', 'Planet']]
+        rows.extend(
+            [system, v[f'{key}_name'], v[f'{key}_meaning_100'],
+             v[f'{key}_element'], v[f'{key}_planet']]
+            for system, key in (('Geomancy', 'geom'), ('I Ching', 'iching'), ('Tarot', 'tarot'))
+        )
         
+        # Format in memory, then one encode and write
+        buf = io.StringIO(newline='')
+        csv.writer(buf).writerows(rows)
         with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['System', 'Name', 'Meaning', 'Element', 'Planet'])
-            writer.writerow(['Geomancy', 
-                            result['geomantic'].get('name', ''),
-                            result['geomantic'].get('meaning', '')[:100],
-                            result['geomantic'].get('element', ''),
-                            result['geomantic'].get('planet', '')])
-            writer.writerow(['I Ching',
-                            result['iching']['primary'].get('english', ''),
-                            result['iching']['primary'].get('judgment_english', '')[:100],
-                            result['iching']['primary'].get('element', ''),
-                            result['iching']['primary'].get('planet', '')])
-            writer.writerow(['Tarot',
-                            result['tarot'].get('name', ''),
-                            result['tarot'].get('meaning', '')[:100],
-                            result['tarot'].get('element', ''),
-                            result['tarot'].get('planet', '')])
+            f.write(buf.getvalue())
         
         print(f"✓ Exported to CSV: {filename}")
     
@@ -2298,7 +2999,6 @@ class QuadrupleGoddessSystem:
         print("="*60)
         
         geomantic = result['geomantic']
-        planetary_hour = self.hour_calculator.calculate_current_planetary_hour()
         
         print(f"\nBased on {geomantic['name']} ({geomantic['planet']}):")
         print(f"   Best planetary hour: {geomantic['planet']} hour")
@@ -2306,8 +3006,7 @@ class QuadrupleGoddessSystem:
         print(f"   Best element: {geomantic['element']}")
         
         # Calculate next optimal hour
-        schedule = self.hour_calculator.get_planetary_hour_schedule()
-        optimal_hours = [h for h in schedule if h['planet'] == geomantic['planet']]
+        optimal_hours = _build_schedule_index(datetime.now().weekday()).get(geomantic['planet'])
         
         if optimal_hours:
             next_hour = optimal_hours[0]
@@ -2336,42 +3035,24 @@ class QuadrupleGoddessSystem:
     
     def generate_custom_square(self, size):
         """Generate custom magic square of given size"""
-        square = [[0] * size for _ in range(size)]
-        
-        # Siamese method for odd sizes
-        if size % 2 == 1:
-            i, j = 0, size // 2
-            for num in range(1, size*size + 1):
-                square[i][j] = num
-                new_i, new_j = (i - 1) % size, (j + 1) % size
-                if square[new_i][new_j]:
-                    i = (i + 1) % size
-                else:
-                    i, j = new_i, new_j
-        else:
-            # For even sizes, use simple pattern
-            num = 1
-            for i in range(size):
-                for j in range(size):
-                    square[i][j] = num
-                    num += 1
-        
-        return square
+        # Fresh lists so callers may edit the square without touching the cache
+        return [list(row) for row in _custom_square(size)]
     
     def save_magic_square(self, square, title):
         """Save magic square to file"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"magic_squares/{title.replace(' ', '_')}_{timestamp}.txt"
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        filename = f"{self._ensure_dir('magic_squares')}/{title.replace(' ', '_')}_{timestamp}.txt"
         
-        Path("magic_squares").mkdir(exist_ok=True)
+        lines = [
+            f"Magic Square: {title}\n",
+            f"Generated: {now.isoformat()}\n",
+            "="*40 + "\n\n"
+        ]
+        lines.extend(" ".join(f"{num:3d}" for num in row) + "\n" for row in square)
         
         with open(filename, 'w') as f:
-            f.write(f"Magic Square: {title}\n")
-            f.write(f"Generated: {datetime.now().isoformat()}\n")
-            f.write("="*40 + "\n\n")
-            
-            for row in square:
-                f.write(" ".join(f"{num:3d}" for num in row) + "\n")
+            f.write("".join(lines))
         
         print(f"✓ Square saved to {filename}")
     
@@ -2388,19 +3069,7 @@ class QuadrupleGoddessSystem:
     
     def get_moon_phase(self):
         """Calculate approximate moon phase"""
-        days_in_cycle = 29.53
-        known_new_moon = datetime(2024, 1, 11)
-        days_since = (datetime.now() - known_new_moon).days
-        phase = (days_since % days_in_cycle) / days_in_cycle
-        
-        if phase < 0.25:
-            return "Waxing Crescent 🌒"
-        elif phase < 0.5:
-            return "First Quarter 🌓"
-        elif phase < 0.75:
-            return "Waning Gibbous 🌖"
-        else:
-            return "Last Quarter 🌗"
+        return _moon_phase(datetime.now().date())
     
     def get_contraindication(self, geomantic):
         """Get contraindication for geomantic figure"""
@@ -2440,122 +3109,99 @@ class QuadrupleGoddessSystem:
     
     def get_planet_quality(self, planet):
         """Get quality description for a planet"""
-        qualities = {
-            "Sun": "Vitality, success, leadership",
-            "Moon": "Intuition, emotions, receptivity",
-            "Mercury": "Communication, intellect, travel",
-            "Venus": "Love, beauty, harmony",
-            "Mars": "Action, courage, conflict",
-            "Jupiter": "Expansion, luck, wisdom",
-            "Saturn": "Discipline, structure, karma"
-        }
-        return qualities.get(planet, "Neutral influence")
+        return _PLANET_QUALITIES.get(_as_planet(planet), "Neutral influence")
     
     # ============ REFERENCE METHODS ============
     
+    def _reference_text(self, kind, data, render):
+        """Rendered reference table, rebuilt only if its source data was replaced"""
+        cached = self._reference_cache.get(kind)
+        if cached is None or cached[0] is not data:
+            cached = self._reference_cache[kind] = (data, render(data))
+        return cached[1]
+    
     def display_geomancy_reference(self):
         """Display geomancy reference table"""
-        print("\n🧿 GEOMANCY FIGURES REFERENCE")
-        print("="*60)
-        
-        for binary, figure in self.geomancy_figures.get("figures", {}).items():
-            print(f"\n{binary}: {figure['name']}")
-            print(f"   Planet: {figure['planet']}")
-            print(f"   Element: {figure['element']}")
-            print(f"   Meaning: {figure['meaning'][:80]}...")
+        print(self._reference_text("geomancy", self.geomancy_figures, _render_geomancy_reference))
     
     def display_iching_reference(self):
         """Display I Ching reference"""
-        print("\n📜 I CHING HEXAGRAMS REFERENCE")
-        print("="*60)
-        
-        for binary, hexagram in self.iching_hexagrams.get("hexagrams", {}).items():
-            print(f"\n#{hexagram['number']}: {hexagram['english']} ({hexagram['chinese']})")
-            print(f"   Binary: {binary}")
-            print(f"   {hexagram['judgment_english'][:60]}...")
+        print(self._reference_text("iching", self.iching_hexagrams, _render_iching_reference))
     
     def display_tarot_reference(self):
         """Display tarot reference"""
-        print("\n🃏 TAROT REFERENCE")
-        print("="*60)
-        
-        # Major Arcana
-        print("\nMAJOR ARCANA:")
-        for card in self.tarot_major.get("major_arcana", []):
-            print(f"  {card['number']:2d}. {card['name']}: {card['meaning'][:40]}...")
-        
-        # Minor Arcana
-        print("\nMINOR ARCANA:")
-        suits = ["wands", "cups", "swords", "pentacles"]
-        for suit in suits:
-            cards = self.tarot_major.get("minor_arcana", {}).get(suit, [])
-            if cards:
-                print(f"\n  {suit.upper()}:")
-                for card in cards[:3]:
-                    print(f"    {card['name']}")
+        print(self._reference_text("tarot", self.tarot_major, _render_tarot_reference))
     
     def display_jafr_reference(self):
         """Display Jafr correspondences"""
-        print("\n📿 JAFR CORRESPONDENCES")
-        print("="*60)
-        
-        for figure, data in self.jafr_correspondences.items():
-            print(f"\n{figure}:")
-            print(f"   Letter: {data['letter']} (Value: {data['value']})")
-            print(f"   Square: {data['square']}")
-            print(f"   Angel: {data['angel']}")
-            print(f"   Use: {data['use'][:60]}...")
+        print(self._reference_text("jafr", self.jafr_correspondences, _render_jafr_reference))
     
     def display_planetary_reference(self):
         """Display planetary correspondences"""
-        print("\n🪐 PLANETARY CORRESPONDENCES")
-        print("="*60)
-        
-        planets = {
-            "Sun": {"element": "Fire", "day": "Sunday", "metal": "Gold", "color": "Gold/Yellow"},
-            "Moon": {"element": "Water", "day": "Monday", "metal": "Silver", "color": "Silver/White"},
-            "Mercury": {"element": "Air", "day": "Wednesday", "metal": "Mercury/Quicksilver", "color": "Orange/Yellow"},
-            "Venus": {"element": "Water", "day": "Friday", "metal": "Copper", "color": "Green"},
-            "Mars": {"element": "Fire", "day": "Tuesday", "metal": "Iron", "color": "Red"},
-            "Jupiter": {"element": "Air", "day": "Thursday", "metal": "Tin", "color": "Blue/Purple"},
-            "Saturn": {"element": "Earth", "day": "Saturday", "metal": "Lead", "color": "Black/Indigo"}
-        }
-        
-        for planet, data in planets.items():
-            print(f"\n{planet}:")
-            print(f"   Element: {data['element']}")
-            print(f"   Day: {data['day']}")
-            print(f"   Metal: {data['metal']}")
-            print(f"   Color: {data['color']}")
+        print(_PLANETARY_REFERENCE_TEXT)
     
     def display_elemental_reference(self):
         """Display elemental correspondences"""
-        print("\n🌟 ELEMENTAL CORRESPONDENCES")
-        print("="*60)
-        
-        elements = {
-            "Fire": {"direction": "South", "season": "Summer", "time": "Noon", "quality": "Hot/Dry"},
-            "Water": {"direction": "West", "season": "Autumn", "time": "Sunset", "quality": "Cold/Wet"},
-            "Air": {"direction": "East", "season": "Spring", "time": "Dawn", "quality": "Hot/Wet"},
-            "Earth": {"direction": "North", "season": "Winter", "time": "Midnight", "quality": "Cold/Dry"},
-            "Metal": {"direction": "West", "season": "Autumn", "planet": "Venus", "quality": "Contracting"},
-            "Wood": {"direction": "East", "season": "Spring", "planet": "Jupiter", "quality": "Expanding"}
-        }
-        
-        for element, data in elements.items():
-            print(f"\n{element}:")
-            for key, value in data.items():
-                print(f"   {key.capitalize()}: {value}")
+        print(_ELEMENTAL_REFERENCE_TEXT)
     
     # ============ SYSTEM INFO AND HELP ============
     
-def display_help(self):
-    """Display help and instructions"""
-    print("\n" + "="*60)
-    print("❓ HELP & INSTRUCTIONS")
-    print("="*60)
-    
-    help_text = """
+# Menu screens for the system menus, each printed in a single call
+_MAIN_MENU_TEXT = "\n".join([
+    "\nMAIN MENU:",
+    "  1. 🧿 Run Divination Reading",
+    "  2. 📊 System Information",
+    "  3. ❓ Help & Instructions",
+    "  4. 🔍 Verify System",
+    "  5. 📚 View Reference Tables",
+    "  6. ⏰ Planetary Hours Calculator",
+    "  7. 🔢 Magic Square Generator",
+    "  8. 📖 Reading History",
+    "  9. ⚙️  Settings",
+    "  0. 🚪 Exit"
+])
+
+_REFERENCE_TABLES_MENU_TEXT = "\n".join([
+    "\n" + "="*60,
+    "📚 REFERENCE TABLES",
+    "="*60,
+    "\nSelect table:",
+    "  1. 🧿 Geomancy Figures",
+    "  2. 📜 I Ching Hexagrams",
+    "  3. 🃏 Tarot Major Arcana",
+    "  4. 📿 Jafr Correspondences",
+    "  5. 🪐 Planetary Correspondences",
+    "  6. 🌟 Elemental Correspondences",
+    "  7. 🔙 Back"
+])
+
+_SETTINGS_MENU_TEXT = "\n".join([
+    "\n" + "="*60,
+    "⚙️  SETTINGS",
+    "="*60,
+    "\nSelect setting:",
+    "  1. 💾 Data Management",
+    "  2. 🎨 Display Preferences",
+    "  3. 🔐 Security & Privacy",
+    "  4. 🔄 Reset System",
+    "  5. 🔙 Back"
+])
+
+_DATA_MANAGEMENT_MENU_TEXT = "\n".join([
+    "\n💾 DATA MANAGEMENT",
+    "="*60,
+    "\n1. Backup all readings",
+    "2. Restore from backup",
+    "3. Clear all data",
+    "4. Export all to JSON",
+    "5. Back"
+])
+
+_HELP_TEXT = "\n".join([
+    "\n" + "="*60,
+    "❓ HELP & INSTRUCTIONS",
+    "="*60,
+    """
     QUADRUPLE GODDESS IMPLEMENTATION GUIDE:
     1. Save the Python code as 'sarah.py'
     2. Run: python sarah.py
@@ -2636,8 +3282,11 @@ def display_help(self):
     • Exports in: exports/ (multiple formats)
     • Backups in: backups/ (automatic & manual)
     """
-    
-    print(help_text)
+])
+
+def display_help(self):
+    """Display help and instructions"""
+    print(_HELP_TEXT)
     
     def verify_system(self):
         """Verify system integrity"""
@@ -2645,11 +3294,15 @@ def display_help(self):
         print("🔍 SYSTEM VERIFICATION")
         print("="*60)
         
+        has_geomancy = len(self.geomancy_figures.get('figures', {})) > 0
+        has_iching = len(self.iching_hexagrams.get('hexagrams', {})) > 0
+        has_tarot = len(self.tarot_major.get('major_arcana', [])) > 0
+        
         checks = [
-            ("Python Version", platform.python_version() >= "3.6", "✓"),
-            ("Geomancy Data", len(self.geomancy_figures.get('figures', {})) > 0, "✓" if len(self.geomancy_figures.get('figures', {})) > 0 else "✗"),
-            ("I Ching Data", len(self.iching_hexagrams.get('hexagrams', {})) > 0, "✓" if len(self.iching_hexagrams.get('hexagrams', {})) > 0 else "✗"),
-            ("Tarot Data", len(self.tarot_major.get('major_arcana', [])) > 0, "✓" if len(self.tarot_major.get('major_arcana', [])) > 0 else "✗"),
+            ("Python Version", sys.version_info >= (3, 6), "✓"),
+            ("Geomancy Data", has_geomancy, "✓" if has_geomancy else "✗"),
+            ("I Ching Data", has_iching, "✓" if has_iching else "✗"),
+            ("Tarot Data", has_tarot, "✓" if has_tarot else "✗"),
             ("History System", True, "✓"),
             ("Magic Squares", True, "✓")
         ]
@@ -2669,18 +3322,7 @@ def display_help(self):
     
     def reference_tables_menu(self):
         """Menu for reference tables"""
-        print("\n" + "="*60)
-        print("📚 REFERENCE TABLES")
-        print("="*60)
-        
-        print("\nSelect table:")
-        print("  1. 🧿 Geomancy Figures")
-        print("  2. 📜 I Ching Hexagrams")
-        print("  3. 🃏 Tarot Major Arcana")
-        print("  4. 📿 Jafr Correspondences")
-        print("  5. 🪐 Planetary Correspondences")
-        print("  6. 🌟 Elemental Correspondences")
-        print("  7. 🔙 Back")
+        print(_REFERENCE_TABLES_MENU_TEXT)
         
         choice = input("\nSelect (1-7): ").strip()
         
@@ -2699,16 +3341,7 @@ def display_help(self):
     
     def settings_menu(self):
         """System settings menu"""
-        print("\n" + "="*60)
-        print("⚙️  SETTINGS")
-        print("="*60)
-        
-        print("\nSelect setting:")
-        print("  1. 💾 Data Management")
-        print("  2. 🎨 Display Preferences")
-        print("  3. 🔐 Security & Privacy")
-        print("  4. 🔄 Reset System")
-        print("  5. 🔙 Back")
+        print(_SETTINGS_MENU_TEXT)
         
         choice = input("\nSelect (1-5): ").strip()
         
@@ -2723,14 +3356,7 @@ def display_help(self):
     
     def data_management(self):
         """Data management settings"""
-        print("\n💾 DATA MANAGEMENT")
-        print("="*60)
-        
-        print("\n1. Backup all readings")
-        print("2. Restore from backup")
-        print("3. Clear all data")
-        print("4. Export all to JSON")
-        print("5. Back")
+        print(_DATA_MANAGEMENT_MENU_TEXT)
         
         choice = input("\nSelect: ").strip()
         
@@ -2739,39 +3365,40 @@ def display_help(self):
         elif choice == "3":
             confirm = input("⚠️ Clear ALL data? (type 'DELETE' to confirm): ")
             if confirm == "DELETE":
-                self.history_manager.history = []
-                self.history_manager.save_history()
+                self.history_manager.clear_history()
                 print("✓ All data cleared")
         elif choice == "4":
             file = self.history_manager.export_to_json()
             print(f"✓ Exported to JSON: {file}")
     
     def backup_data(self):
-        """Backup all data"""
-        import shutil
-        import os
-        
+        """Backup all data into a single compressed archive"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_dir = f"backups/backup_{timestamp}"
-        
-        Path(backup_dir).mkdir(parents=True, exist_ok=True)
-        
-        # Copy data files
-        data_files = ["data/geomancy.json", "data/iching.json", 
-                      "data/tarot.json", "data/jafr.json"]
+        name = f"backup_{timestamp}"
+        archive = f"backups/{name}.tar.gz"
         
-        for file in data_files:
-            if os.path.exists(file):
-                shutil.copy2(file, backup_dir)
+        Path("backups").mkdir(exist_ok=True)
         
-        # Copy readings
-        if os.path.exists("readings"):
-            shutil.copytree("readings", f"{backup_dir}/readings")
+        # Get buffered history entries onto disk before archiving readings/
+        self.history_manager.flush()
+        history = self.history_manager.export_bytes()
         
-        # Export history
-        self.history_manager.export_to_json(f"{backup_dir}/history.json")
+        with tarfile.open(archive, "w:gz") as tf:
+            # Data files at the top level, as plain copies would be
+            for _, file in QuadrupleGoddessSystem.DATA_FILES.values():
+                if os.path.exists(file):
+                    tf.add(file, arcname=f"{name}/{os.path.basename(file)}")
+            
+            if os.path.exists("readings"):
+                tf.add("readings", arcname=f"{name}/readings")
+            
+            # History export goes straight from memory into the archive
+            info = tarfile.TarInfo(f"{name}/history.json")
+            info.size = len(history)
+            info.mtime = int(datetime.now().timestamp())
+            tf.addfile(info, io.BytesIO(history))
         
-        print(f"✓ Backup created: {backup_dir}")
+        print(f"✓ Backup created: {archive}")
     
     def display_preferences(self):
         """Display preferences menu"""
@@ -2797,28 +3424,16 @@ def display_help(self):
         """Reset system to defaults"""
         confirm = input("\n⚠️ RESET SYSTEM? All data will be lost! (type 'RESET' to confirm): ")
         if confirm == "RESET":
-            self.history_manager.history = []
-            self.history_manager.save_history()
+            self.history_manager.clear_history()
             print("✓ System reset to defaults")
     
     # ============ MAIN MENU ============
     def main_menu(self):
         """Enhanced main menu"""
         while True:
-            print("\n" + "="*60)
-            print(f"🔮 QUADRUPLE GODDESS v{self.version}")
-            print("="*60)
-            print("\nMAIN MENU:")
-            print("  1. 🧿 Run Divination Reading")
-            print("  2. 📊 System Information")
-            print("  3. ❓ Help & Instructions")
-            print("  4. 🔍 Verify System")
-            print("  5. 📚 View Reference Tables")
-            print("  6. ⏰ Planetary Hours Calculator")
-            print("  7. 🔢 Magic Square Generator")
-            print("  8. 📖 Reading History")
-            print("  9. ⚙️  Settings")
-            print("  0. 🚪 Exit")
+            # Only the version line varies between renders
+            print("\n" + "="*60 + f"\n🔮 QUADRUPLE GODDESS v{self.version}\n" + "="*60 + "\n"
+                  + _MAIN_MENU_TEXT)
             
             choice = input("\nSelect option (0-9): ").strip()
             